@@ -2,34 +2,26 @@
 
 from __future__ import annotations
 
-import sys
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlparse
 
 import typer
 from dotenv import load_dotenv
 
 from rss_to_wp import __version__
-from rss_to_wp.config import (
-    AppSettings,
-    FeedConfig,
-    get_app_settings,
-    load_feeds_config,
-)
-from rss_to_wp.feeds import (
-    generate_entry_key,
-    get_entry_content,
-    get_entry_link,
-    get_entry_title,
-    parse_feed,
-    pick_entries,
-)
-from rss_to_wp.images import download_image, find_fallback_image, find_rss_image
-from rss_to_wp.rewriter import OpenAIRewriter
-from rss_to_wp.storage import DedupeStore
-from rss_to_wp.utils import get_logger, setup_logging, send_email_notification, build_summary_email
-from rss_to_wp.wordpress import WordPressClient
+
+# Heavy dependencies (openai, requests, pydantic, pendulum, ...) are
+# imported inside the commands that need them, so cheap invocations like
+# --version don't pay hundreds of ms of import time on every cron tick
+if TYPE_CHECKING:
+    from rss_to_wp.config import AppSettings, FeedConfig
+    from rss_to_wp.rewriter import OpenAIRewriter
+    from rss_to_wp.storage import DedupeStore
+    from rss_to_wp.utils import HostRateLimiter
+    from rss_to_wp.wordpress import WordPressClient
 
 # Load environment variables from .env file
 load_dotenv()
@@ -94,6 +86,18 @@ def run(
 
     Fetches RSS feeds, rewrites content, and publishes to WordPress.
     """
+    from rss_to_wp.config import get_app_settings, load_feeds_config
+    from rss_to_wp.feeds import parse_feeds
+    from rss_to_wp.rewriter import OpenAIRewriter
+    from rss_to_wp.storage import DedupeStore
+    from rss_to_wp.utils import (
+        HostRateLimiter,
+        build_summary_email,
+        send_email_notification,
+        setup_logging,
+    )
+    from rss_to_wp.wordpress import WordPressClient
+
     # Load settings
     try:
         settings = get_app_settings()
@@ -129,15 +133,21 @@ def run(
 
     # Filter to single feed if specified
     if single_feed:
-        feeds = [f for f in feeds if f.name.lower() == single_feed.lower()]
-        if not feeds:
+        feed_config = feeds_config.by_name.get(single_feed.lower())
+        if feed_config is None:
             logger.error("feed_not_found", name=single_feed)
             raise typer.Exit(1)
+        feeds = [feed_config]
 
     logger.info("feeds_loaded", count=len(feeds))
 
     # Initialize components
     dedupe_store = DedupeStore()
+    rate_limiter = HostRateLimiter(default_interval=settings.feed_min_interval)
+    rate_limiter.set_interval(
+        urlparse(settings.wordpress_base_url).netloc,
+        settings.wordpress_min_interval,
+    )
     rewriter = OpenAIRewriter(
         api_key=settings.openai_api_key,
         model=settings.openai_model,
@@ -152,15 +162,38 @@ def run(
             default_status=settings.wordpress_post_status,
         )
 
-    # Process each feed
+    # Process feeds concurrently - feed fetching is I/O-bound, so threads
+    # overlap the network waits (feedparser.parse is thread-safe)
     total_processed = 0
     total_skipped = 0
     total_errors = 0
     published_articles: list[dict] = []  # Track for email notification
+    state_lock = threading.Lock()  # Guards dedupe_store and published_articles
+
+    # Fetch and parse all feeds in one concurrent batch up front, so the
+    # per-feed workers only do entry processing. Conditional GETs with the
+    # stored ETag/Last-Modified let unchanged feeds come back as 304s
+    # without re-downloading or re-parsing anything.
+    feed_urls = [feed_config.url for feed_config in feeds]
+    parsed_feeds = parse_feeds(
+        feed_urls,
+        fast_parse=settings.feed_fast_parse,
+        cache_meta={url: dedupe_store.get_feed_meta(url) for url in feed_urls},
+    )
+    for url, parsed in parsed_feeds.items():
+        if parsed is not None and parsed.get("status") != 304:
+            dedupe_store.update_feed_meta(
+                url,
+                etag=parsed.get("etag"),
+                modified=parsed.get("modified"),
+            )
 
-    for feed_config in feeds:
-        try:
-            processed, skipped, errors = process_feed(
+    # max(1, ...): an empty feed list is valid config, and ThreadPoolExecutor
+    # rejects max_workers=0
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(feeds)))) as executor:
+        futures = {
+            executor.submit(
+                process_feed,
                 feed_config=feed_config,
                 settings=settings,
                 dedupe_store=dedupe_store,
@@ -170,22 +203,27 @@ def run(
                 hours=hours,
                 logger=logger,
                 published_articles=published_articles,  # Pass for tracking
-            )
-            total_processed += processed
-            total_skipped += skipped
-            total_errors += errors
-
-            # Rate limit between feeds
-            time.sleep(1)
-
-        except Exception as e:
-            logger.error(
-                "feed_processing_error",
-                feed=feed_config.name,
-                error=str(e),
-            )
-            total_errors += 1
-            continue
+                state_lock=state_lock,
+                rate_limiter=rate_limiter,
+                feed=parsed_feeds.get(feed_config.url),
+            ): feed_config
+            for feed_config in feeds
+        }
+
+        for future in as_completed(futures):
+            feed_config = futures[future]
+            try:
+                processed, skipped, errors = future.result()
+                total_processed += processed
+                total_skipped += skipped
+                total_errors += errors
+            except Exception as e:
+                logger.error(
+                    "feed_processing_error",
+                    feed=feed_config.name,
+                    error=str(e),
+                )
+                total_errors += 1
 
     # Summary
     logger.info(
@@ -234,20 +272,48 @@ def process_feed(
     hours: int,
     logger,
     published_articles: Optional[list[dict]] = None,
+    state_lock: Optional[threading.Lock] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    feed: Optional[dict] = None,
 ) -> tuple[int, int, int]:
     """Process a single feed.
 
+    Safe to call from multiple threads when state_lock is provided - the lock
+    guards dedupe_store and published_articles mutations.
+
     Returns:
         Tuple of (processed_count, skipped_count, error_count)
     """
+    from rss_to_wp.feeds import (
+        generate_entry_key,
+        get_entry_link,
+        get_entry_title,
+        parse_feed,
+        pick_entries,
+    )
+    from rss_to_wp.utils import HostRateLimiter
+
+    if state_lock is None:
+        state_lock = threading.Lock()
+    if rate_limiter is None:
+        rate_limiter = HostRateLimiter(default_interval=settings.feed_min_interval)
+
+    feed_host = urlparse(feed_config.url).netloc
     logger.info("processing_feed", name=feed_config.name, url=feed_config.url)
 
     processed = 0
     skipped = 0
     errors = 0
 
-    # Parse feed
-    feed = parse_feed(feed_config.url)
+    # Parse feed unless the caller already did (see parse_feeds batching)
+    if feed is None:
+        feed = parse_feed(feed_config.url, fast_parse=settings.feed_fast_parse)
+
+    # Unchanged since last fetch (conditional GET) - nothing to do
+    if feed is not None and feed.get("status") == 304:
+        logger.info("feed_not_modified", name=feed_config.name)
+        return (0, 0, 0)
+
     if not feed or not feed.entries:
         logger.warning("feed_empty_or_failed", name=feed_config.name)
         return (0, 0, 1)
@@ -266,65 +332,105 @@ def process_feed(
 
     logger.info("entries_to_process", name=feed_config.name, count=len(entries))
 
-    for entry in entries:
-        try:
-            # Generate unique key
-            entry_key = generate_entry_key(entry, feed_config.url)
-
-            # Check if already processed
-            if dedupe_store.is_processed(entry_key):
-                logger.info(
-                    "entry_skipped_duplicate",
-                    key=entry_key,
-                    title=get_entry_title(entry)[:50],
-                )
-                skipped += 1
-                continue
-
-            # Process entry
-            result = process_entry(
-                entry=entry,
-                feed_config=feed_config,
-                settings=settings,
-                rewriter=rewriter,
-                wp_client=wp_client,
-                dry_run=dry_run,
-                logger=logger,
+    # One dedupe query for the whole feed instead of one per entry
+    entry_keys = [generate_entry_key(entry, feed_config.url) for entry in entries]
+    with state_lock:
+        processed_keys = dedupe_store.is_processed_many(entry_keys)
+
+    # Skip known duplicates up front so the worker pool only sees real work
+    pending: list[tuple] = []
+    for entry, entry_key in zip(entries, entry_keys):
+        if entry_key in processed_keys:
+            logger.info(
+                "entry_skipped_duplicate",
+                key=entry_key,
+                title=get_entry_title(entry)[:50],
             )
+            skipped += 1
+        else:
+            pending.append((entry, entry_key))
+
+    if not pending:
+        return (processed, skipped, errors)
+
+    def process_one(entry, entry_key: str) -> Optional[tuple[tuple, Optional[dict]]]:
+        """Rewrite and publish one entry.
+
+        Returns:
+            Tuple of (mark_processed_many row, notification article dict
+            or None) on success, None on failure. Marking is left to the
+            feed thread so the whole feed lands in one batched commit.
+        """
+        result = process_entry(
+            entry=entry,
+            feed_config=feed_config,
+            settings=settings,
+            rewriter=rewriter,
+            wp_client=wp_client,
+            dry_run=dry_run,
+            logger=logger,
+        )
 
-            if result:
-                # Mark as processed
-                dedupe_store.mark_processed(
-                    entry_key=entry_key,
-                    feed_url=feed_config.url,
-                    entry_title=get_entry_title(entry),
-                    entry_link=get_entry_link(entry) or "",
-                    wp_post_id=result.get("id"),
-                    wp_post_url=result.get("link"),
+        outcome = None
+        if result:
+            row = (
+                entry_key,
+                feed_config.url,
+                get_entry_title(entry),
+                get_entry_link(entry) or "",
+                result.get("id"),
+                result.get("link"),
+            )
+            article = None
+            if result.get("link"):
+                article = {
+                    "title": result.get("title", {}).get("rendered", get_entry_title(entry)),
+                    "url": result.get("link"),
+                    "feed_name": feed_config.name,
+                }
+            outcome = (row, article)
+
+        # Rate limit per source host - entries bound for independent
+        # hosts no longer serialize behind each other
+        rate_limiter.acquire(feed_host)
+        return outcome
+
+    # Overlap entries within the feed: while entry K waits on OpenAI,
+    # entry K-1 can be mid-publish to WordPress. A small bounded pool keeps
+    # total in-flight work modest on top of the feed-level concurrency;
+    # the rewriter's token budget still enforces the RPM/TPM ceiling.
+    rows: list[tuple] = []
+    new_articles: list[dict] = []
+    with ThreadPoolExecutor(max_workers=min(3, len(pending))) as entry_pool:
+        futures = {
+            entry_pool.submit(process_one, entry, entry_key): entry
+            for entry, entry_key in pending
+        }
+        for future in as_completed(futures):
+            try:
+                outcome = future.result()
+                if outcome:
+                    row, article = outcome
+                    rows.append(row)
+                    if article:
+                        new_articles.append(article)
+                    processed += 1
+                else:
+                    errors += 1
+            except Exception as e:
+                logger.error(
+                    "entry_processing_error",
+                    title=get_entry_title(futures[future])[:50],
+                    error=str(e),
                 )
-                processed += 1
-                
-                # Track for email notification
-                if published_articles is not None and result.get("link"):
-                    published_articles.append({
-                        "title": result.get("title", {}).get("rendered", get_entry_title(entry)),
-                        "url": result.get("link"),
-                        "feed_name": feed_config.name,
-                    })
-            else:
                 errors += 1
 
-            # Rate limit between entries
-            time.sleep(1)
-
-        except Exception as e:
-            logger.error(
-                "entry_processing_error",
-                title=get_entry_title(entry)[:50],
-                error=str(e),
-            )
-            errors += 1
-            continue
+    # One batched commit per feed instead of one fsync per entry
+    if rows:
+        with state_lock:
+            dedupe_store.mark_processed_many(rows)
+            if published_articles is not None:
+                published_articles.extend(new_articles)
 
     return (processed, skipped, errors)
 
@@ -343,18 +449,41 @@ def process_entry(
     Returns:
         WordPress post data if successful, None otherwise.
     """
+    from rss_to_wp.feeds import get_entry_content, get_entry_link, get_entry_title
+    from rss_to_wp.images import (
+        download_image,
+        find_fallback_image,
+        find_rss_image,
+        image_result_from_bytes,
+    )
+
     title = get_entry_title(entry)
     content = get_entry_content(entry)
     link = get_entry_link(entry)
 
     logger.info("processing_entry", title=title[:50])
 
-    # Rewrite with OpenAI
-    rewritten = rewriter.rewrite(
-        content=content,
-        original_title=title,
-        use_original_title=feed_config.use_original_title,
-    )
+    # Kick off the RSS image download in the background - it hits a
+    # different endpoint than the rewriter, so the entry latency becomes
+    # max(rewrite, download) instead of their sum
+    image_url = find_rss_image(entry, base_url=link or "")
+    image_future = None
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        if image_url:
+            logger.info("using_rss_image", url=image_url)
+            image_future = executor.submit(download_image, image_url)
+
+        # Rewrite with OpenAI
+        rewritten = rewriter.rewrite(
+            content=content,
+            original_title=title,
+            use_original_title=feed_config.use_original_title,
+        )
+
+        image_result = image_future.result() if image_future else None
+    finally:
+        executor.shutdown(wait=False)
 
     if not rewritten:
         logger.error("rewrite_failed", title=title[:50])
@@ -362,19 +491,13 @@ def process_entry(
 
     # Find image
     featured_media_id = None
-
-    # Try RSS image first
-    image_url = find_rss_image(entry, base_url=link or "")
     image_alt = ""
 
-    if image_url:
-        logger.info("using_rss_image", url=image_url)
-        image_result = download_image(image_url)
-        if image_result:
-            image_bytes, filename, _ = image_result
-            image_alt = title[:100]  # Use title as alt for RSS images
-        else:
-            image_url = None
+    if image_result:
+        image_bytes, filename, _ = image_result
+        image_alt = title[:100]  # Use title as alt for RSS images
+    else:
+        image_url = None
 
     # Fallback to stock photos
     if not image_url:
@@ -386,7 +509,13 @@ def process_entry(
         )
         if fallback:
             logger.info("using_fallback_image", source=fallback["source"])
-            image_result = download_image(fallback["url"])
+            # The provider search may have pipelined the bytes on its
+            # keep-alive connection - skip the second round trip if so
+            prefetched = fallback.pop("_bytes", None)
+            if prefetched:
+                image_result = image_result_from_bytes(prefetched, fallback["url"])
+            else:
+                image_result = download_image(fallback["url"])
             if image_result:
                 image_bytes, filename, _ = image_result
                 image_alt = fallback["alt_text"]
@@ -396,23 +525,38 @@ def process_entry(
         if not fallback:
             logger.warning("no_image_available", title=title[:50])
 
-    # Upload image to WordPress
-    if not dry_run and wp_client and image_result:
-        featured_media_id = wp_client.upload_media(
-            image_bytes=image_bytes,
-            filename=filename,
-            alt_text=image_alt,
-        )
-
-    # Get/create category
+    # Media upload, category, and tag resolution are independent WP
+    # calls - run them concurrently on the client's pooled session so
+    # the prelude costs one RTT instead of three
     category_id = None
-    if not dry_run and wp_client and feed_config.default_category:
-        category_id = wp_client.get_or_create_category(feed_config.default_category)
-
-    # Get/create tags
     tag_ids = []
-    if not dry_run and wp_client and feed_config.default_tags:
-        tag_ids = wp_client.get_or_create_tags(feed_config.default_tags)
+    if not dry_run and wp_client:
+        with ThreadPoolExecutor(max_workers=3) as wp_pool:
+            media_future = None
+            if image_result:
+                media_future = wp_pool.submit(
+                    wp_client.upload_media,
+                    image_bytes=image_bytes,
+                    filename=filename,
+                    alt_text=image_alt,
+                )
+            category_future = None
+            if feed_config.default_category:
+                category_future = wp_pool.submit(
+                    wp_client.get_or_create_category, feed_config.default_category
+                )
+            tags_future = None
+            if feed_config.default_tags:
+                tags_future = wp_pool.submit(
+                    wp_client.get_or_create_tags, feed_config.default_tags
+                )
+
+            if media_future:
+                featured_media_id = media_future.result()
+            if category_future:
+                category_id = category_future.result()
+            if tags_future:
+                tag_ids = tags_future.result()
 
     # Create post
     if dry_run:
@@ -445,6 +589,9 @@ def process_entry(
 @app.command()
 def status() -> None:
     """Show status of processed entries."""
+    from rss_to_wp.storage import DedupeStore
+    from rss_to_wp.utils import setup_logging
+
     logger = setup_logging()
     dedupe_store = DedupeStore()
 
@@ -471,6 +618,8 @@ def clear_db(
     ),
 ) -> None:
     """Clear the processed entries database."""
+    from rss_to_wp.storage import DedupeStore
+
     if not confirm:
         confirm = typer.confirm("Are you sure you want to clear all processed entries?")
 
@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
 import pendulum
 import yaml
 from pydantic import BaseModel, Field, field_validator
+
+try:
+    # libyaml bindings - much faster than the pure-Python loader and
+    # shipped in the default PyYAML wheels
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -36,6 +44,11 @@ class FeedsConfig(BaseModel):
 
     feeds: list[FeedConfig] = Field(default_factory=list)
 
+    @cached_property
+    def by_name(self) -> dict[str, FeedConfig]:
+        """Feeds indexed by lowercased name, for --single-feed lookups."""
+        return {feed.name.lower(): feed for feed in self.feeds}
+
 
 class AppSettings(BaseSettings):
     """Application settings loaded from environment variables."""
@@ -60,6 +73,16 @@ class AppSettings(BaseSettings):
     pexels_api_key: Optional[str] = Field(default=None, description="Pexels API key")
     unsplash_access_key: Optional[str] = Field(default=None, description="Unsplash access key")
 
+    # Feed parsing
+    feed_fast_parse: bool = Field(
+        default=True,
+        description="Skip feedparser HTML sanitizing (the rewriter cleans content itself)",
+    )
+
+    # Rate limiting (seconds between calls to the same host)
+    feed_min_interval: float = Field(default=1.0, description="Min seconds between feed host calls")
+    wordpress_min_interval: float = Field(default=0.2, description="Min seconds between WP calls")
+
     # Logging & Timezone
     log_level: str = Field(default="INFO", description="Log level")
     log_file: Optional[str] = Field(default=None, description="Optional log file path")
@@ -105,9 +128,24 @@ def load_feeds_config(config_path: str | Path) -> FeedsConfig:
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     with open(config_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeLoader)
+
+    config = FeedsConfig.model_validate(data or {"feeds": []})
+
+    # Flag duplicated URLs - they are only fetched once per run
+    seen: dict[str, str] = {}
+    for feed in config.feeds:
+        if feed.url in seen:
+            from rss_to_wp.utils.logging import get_logger
+
+            get_logger("config").warning(
+                "duplicate_feed_url",
+                url=feed.url,
+                feeds=[seen[feed.url], feed.name],
+            )
+        seen.setdefault(feed.url, feed.name)
 
-    return FeedsConfig.model_validate(data or {"feeds": []})
+    return config
 
 
 def get_app_settings() -> AppSettings:
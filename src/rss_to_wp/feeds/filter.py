@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import hashlib
-from datetime import datetime
-from time import mktime, struct_time
+import heapq
+from calendar import timegm
+from datetime import datetime, timezone as dt_timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from time import struct_time
 from typing import Any, Optional
 
 import pendulum
@@ -14,6 +18,16 @@ from rss_to_wp.utils import get_logger
 logger = get_logger("feeds.filter")
 
 
+@lru_cache(maxsize=16)
+def _tz(name: str) -> pendulum.tz.Timezone:
+    """Resolve a timezone name, caching the result.
+
+    pendulum.timezone rebuilds the zone object on every call; runs only
+    ever use a handful of zones.
+    """
+    return pendulum.timezone(name)
+
+
 def parse_entry_date(entry: dict[str, Any]) -> Optional[datetime]:
     """Parse the publication date from an RSS entry.
 
@@ -34,9 +48,11 @@ def parse_entry_date(entry: dict[str, Any]) -> Optional[datetime]:
     for field in date_fields:
         if field in entry and entry[field]:
             try:
+                # feedparser's *_parsed structs are already UTC, so use
+                # timegm - mktime would reinterpret them as local time and
+                # drift entries across the window boundary by the TZ offset
                 time_struct: struct_time = entry[field]
-                timestamp = mktime(time_struct)
-                return datetime.fromtimestamp(timestamp, tz=pendulum.UTC)
+                return datetime.fromtimestamp(timegm(time_struct), tz=dt_timezone.utc)
             except (TypeError, ValueError, OverflowError):
                 continue
 
@@ -44,14 +60,54 @@ def parse_entry_date(entry: dict[str, Any]) -> Optional[datetime]:
     string_fields = ["published", "updated", "created"]
     for field in string_fields:
         if field in entry and entry[field]:
-            try:
-                return pendulum.parse(entry[field])
-            except Exception:
-                continue
+            parsed = _parse_date_string(entry[field])
+            if parsed is not None:
+                return parsed
 
     return None
 
 
+@lru_cache(maxsize=1024)
+def _parse_date_string(value: str) -> Optional[datetime]:
+    """Parse a date string, caching results.
+
+    Tries the formats feeds actually use before falling back to
+    pendulum's reflective autodetection: RFC 2822 (RSS pubDate), then
+    ISO 8601 (Atom). Feeds repeat the same date strings across entries
+    within a poll, so the cache avoids re-parsing either way.
+
+    Args:
+        value: Raw date string from the entry.
+
+    Returns:
+        Datetime object or None if unparseable.
+    """
+    # RFC 2822 - the RSS pubDate format, covers the vast majority
+    try:
+        parsed = parsedate_to_datetime(value)
+        if parsed is not None:
+            if parsed.tzinfo is None:  # "-0000" yields a naive datetime
+                parsed = parsed.replace(tzinfo=dt_timezone.utc)
+            return parsed
+    except (TypeError, ValueError):
+        pass
+
+    # ISO 8601 - Atom published/updated
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if parsed.tzinfo is None:  # offset-less timestamps are taken as UTC
+            parsed = parsed.replace(tzinfo=dt_timezone.utc)
+        return parsed
+    except ValueError:
+        pass
+
+    # Anything else: let pendulum autodetect
+    try:
+        return pendulum.parse(value)
+    except Exception:
+        return None
+
+
 def is_within_window(
     entry_date: datetime,
     hours: int = 48,
@@ -67,7 +123,7 @@ def is_within_window(
     Returns:
         True if entry is within the window.
     """
-    tz = pendulum.timezone(timezone)
+    tz = _tz(timezone)
     now = pendulum.now(tz)
     cutoff = now.subtract(hours=hours)
 
@@ -82,6 +138,7 @@ def pick_entries(
     max_count: int = 5,
     hours_window: int = 48,
     timezone: str = "UTC",
+    assume_sorted: bool = True,
 ) -> list[dict[str, Any]]:
     """Filter and sort entries by date, returning newest first.
 
@@ -92,12 +149,23 @@ def pick_entries(
         max_count: Maximum entries to return.
         hours_window: Time window in hours (strictly enforced).
         timezone: Timezone for date calculations.
+        assume_sorted: Feeds normally list entries newest-first, so once
+            enough entries are collected and the scan reaches one older
+            than the cutoff, stop instead of date-parsing the archive
+            tail. Disabled automatically if out-of-order dates appear.
 
     Returns:
         List of filtered entries, newest first.
     """
     valid_entries: list[tuple[datetime, dict[str, Any]]] = []
 
+    # Compute the window cutoff once - doing the timezone lookup and now()
+    # per entry (via is_within_window) is pure per-entry overhead
+    tz = _tz(timezone)
+    cutoff = pendulum.now(tz).subtract(hours=hours_window)
+
+    prev_date: Optional[datetime] = None
+
     for entry in entries:
         # Get entry link for logging
         link = entry.get("link", "unknown")
@@ -108,8 +176,16 @@ def pick_entries(
             logger.debug("skipping_no_date", link=link)
             continue
 
+        # Out-of-order date: the feed isn't newest-first, full scan only
+        if prev_date is not None and entry_date > prev_date:
+            assume_sorted = False
+        prev_date = entry_date
+
         # Check if within window (strict enforcement)
-        if not is_within_window(entry_date, hours_window, timezone):
+        if entry_date < cutoff:
+            if assume_sorted and len(valid_entries) >= max_count:
+                logger.debug("early_exit_sorted_feed", scanned=len(valid_entries))
+                break
             logger.debug(
                 "skipping_outside_window",
                 link=link,
@@ -125,11 +201,10 @@ def pick_entries(
 
         valid_entries.append((entry_date, entry))
 
-    # Sort by date descending (newest first)
-    valid_entries.sort(key=lambda x: x[0], reverse=True)
-
-    # Take top N
-    result = [entry for _, entry in valid_entries[:max_count]]
+    # Take the newest max_count entries - O(N log K) instead of sorting
+    # the whole list when feeds carry deep archives
+    top = heapq.nlargest(max_count, valid_entries, key=lambda x: x[0])
+    result = [entry for _, entry in top]
 
     logger.info(
         "entries_filtered",
@@ -174,7 +249,9 @@ def generate_entry_key(entry: dict[str, Any], feed_url: str) -> str:
     if entry_date:
         date_str = entry_date.isoformat()
 
+    # BLAKE2b is several times faster than SHA-256 here and a 128-bit
+    # digest is plenty for a non-cryptographic dedup key
     hash_input = f"{title}|{date_str}|{feed_url}"
-    hash_value = hashlib.sha256(hash_input.encode()).hexdigest()[:32]
+    hash_value = hashlib.blake2b(hash_input.encode(), digest_size=16).hexdigest()
 
     return f"hash:{hash_value}"
@@ -1,6 +1,12 @@
 """Image handling module."""
 
-from rss_to_wp.images.downloader import download_image, extract_keywords, find_fallback_image
+from rss_to_wp.images.downloader import (
+    download_image,
+    download_images,
+    extract_keywords,
+    find_fallback_image,
+    image_result_from_bytes,
+)
 from rss_to_wp.images.pexels import PexelsClient
 from rss_to_wp.images.rss_extractor import find_rss_image, is_valid_image_url
 from rss_to_wp.images.unsplash import UnsplashClient
@@ -9,6 +15,8 @@ __all__ = [
     "find_rss_image",
     "is_valid_image_url",
     "download_image",
+    "download_images",
+    "image_result_from_bytes",
     "extract_keywords",
     "find_fallback_image",
     "PexelsClient",
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import BytesIO
 from typing import Optional
 from urllib.parse import urlparse
@@ -11,11 +13,62 @@ import requests
 from PIL import Image
 
 from rss_to_wp.images.pexels import PexelsClient
+from rss_to_wp.images.providers import fetch_image_bytes
 from rss_to_wp.images.unsplash import UnsplashClient
-from rss_to_wp.utils import get_logger
+from rss_to_wp.utils import create_http_session, get_logger
 
 logger = get_logger("images.downloader")
 
+# Shared pooled session - repeat downloads from the same CDN reuse
+# keep-alive sockets instead of paying a TCP+TLS handshake per image
+_session = create_http_session(pool_connections=16, pool_maxsize=32, max_retries=2)
+
+# Hoisted from extract_keywords - rebuilt per call they cost a set
+# construction and a regex compile on every entry
+_STOPWORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
+    "be", "have", "has", "had", "do", "does", "did", "will", "would",
+    "could", "should", "may", "might", "must", "shall", "can", "need",
+    "this", "that", "these", "those", "it", "its", "their", "our", "your",
+    "new", "announces", "released", "says", "reports", "today", "week",
+})
+_NONWORD_RE = re.compile(r"[^\w\s]")
+
+
+@lru_cache(maxsize=4)
+def _get_pexels(api_key: str) -> PexelsClient:
+    """Memoized Pexels client so its session pool survives across entries."""
+    return PexelsClient(api_key)
+
+
+@lru_cache(maxsize=4)
+def _get_unsplash(access_key: str) -> UnsplashClient:
+    """Memoized Unsplash client so its session pool survives across entries."""
+    return UnsplashClient(access_key)
+
+
+def _sniff_image(content: bytes) -> Optional[str]:
+    """Identify an image format from its magic bytes.
+
+    Args:
+        content: Raw file content.
+
+    Returns:
+        MIME type string, or None if the signature is unrecognized.
+    """
+    if content.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if content.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if content.startswith(b"GIF8"):
+        return "image/gif"
+    if content[:4] == b"RIFF" and content[8:12] == b"WEBP":
+        return "image/webp"
+    if content.startswith(b"BM"):
+        return "image/bmp"
+    return None
+
 
 def download_image(
     url: str,
@@ -35,24 +88,74 @@ def download_image(
     logger.info("downloading_image", url=url)
 
     try:
-        response = requests.get(
+        response = _session.get(
             url,
             timeout=timeout,
-            headers={"User-Agent": "RSS-to-WP-Bot/1.0"},
             stream=True,
         )
         response.raise_for_status()
 
-        # Check content length
+        max_bytes = int(max_size_mb * 1024 * 1024)
+
+        # Fast-path reject on declared size (Content-Length can be absent
+        # or wrong, so the streamed count below is authoritative)
         content_length = response.headers.get("Content-Length")
-        if content_length and int(content_length) > max_size_mb * 1024 * 1024:
+        if content_length and int(content_length) > max_bytes:
             logger.warning("image_too_large", url=url, size_mb=int(content_length) / (1024 * 1024))
             return None
 
-        # Read content
-        content = response.content
+        # Stream into a bounded buffer, aborting as soon as the running
+        # count exceeds the limit - caps both wasted download and peak
+        # memory at max_size_mb regardless of what the server sends
+        buffer = BytesIO()
+        total = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            total += len(chunk)
+            if total > max_bytes:
+                logger.warning("image_too_large", url=url, size_mb=total / (1024 * 1024))
+                response.close()
+                return None
+            buffer.write(chunk)
+
+        content = buffer.getvalue()
+
+        return image_result_from_bytes(
+            content, url, response.headers.get("Content-Type", "image/jpeg")
+        )
+
+    except requests.exceptions.RequestException as e:
+        logger.error("image_download_error", url=url, error=str(e))
+        return None
+    except Exception as e:
+        logger.error("image_download_error", url=url, error=str(e))
+        return None
+
+
+def image_result_from_bytes(
+    content: bytes,
+    url: str,
+    header_type: str = "image/jpeg",
+) -> Optional[tuple[bytes, str, str]]:
+    """Validate already-fetched image bytes and build a download result.
+
+    Used both by download_image and for bytes pre-fetched during a
+    provider search, so prefetched images skip the second round trip
+    without skipping validation.
 
-        # Validate it's actually an image
+    Args:
+        content: Raw image bytes.
+        url: URL the bytes came from, for filename extraction.
+        header_type: Content-Type the server declared, used as fallback.
+
+    Returns:
+        Tuple of (image_bytes, filename, content_type) or None if the
+        bytes are not a recognizable image.
+    """
+    # Validate it's actually an image - magic-byte sniff covers the
+    # common formats without PIL's full-image parse; PIL verify only
+    # runs when the signature is unrecognized
+    sniffed_type = _sniff_image(content)
+    if sniffed_type is None:
         try:
             img = Image.open(BytesIO(content))
             img.verify()
@@ -60,25 +163,48 @@ def download_image(
             logger.warning("invalid_image", url=url, error=str(e))
             return None
 
-        # Determine filename and type
-        content_type = response.headers.get("Content-Type", "image/jpeg")
-        filename = _extract_filename(url, content_type)
+    # Determine filename and type - the sniffed type beats the header,
+    # which CDNs frequently misreport
+    content_type = sniffed_type or header_type
+    filename = _extract_filename(url, content_type)
 
-        logger.info(
-            "image_downloaded",
-            url=url,
-            size_bytes=len(content),
-            content_type=content_type,
-        )
+    logger.info(
+        "image_downloaded",
+        url=url,
+        size_bytes=len(content),
+        content_type=content_type,
+    )
 
-        return (content, filename, content_type)
+    return (content, filename, content_type)
 
-    except requests.exceptions.RequestException as e:
-        logger.error("image_download_error", url=url, error=str(e))
-        return None
-    except Exception as e:
-        logger.error("image_download_error", url=url, error=str(e))
-        return None
+
+def download_images(
+    urls: list[str],
+    max_size_mb: float = 5.0,
+    timeout: tuple[int, int] = (10, 30),
+    max_workers: int = 8,
+) -> list[Optional[tuple[bytes, str, str]]]:
+    """Download multiple images concurrently.
+
+    Fans download_image out over a thread pool sharing the pooled module
+    session, so independent fetches overlap their network waits.
+
+    Args:
+        urls: Image URLs to download.
+        max_size_mb: Maximum file size in MB, per image.
+        timeout: Request timeout (connect, read).
+        max_workers: Maximum concurrent downloads.
+
+    Returns:
+        Results in input order; None where a download failed.
+    """
+    if not urls:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(
+            executor.map(lambda url: download_image(url, max_size_mb, timeout), urls)
+        )
 
 
 def _extract_filename(url: str, content_type: str) -> str:
@@ -125,22 +251,12 @@ def extract_keywords(text: str, max_words: int = 5) -> str:
     Returns:
         Cleaned keyword string.
     """
-    # Remove common stop words
-    stop_words = {
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-        "of", "with", "by", "from", "as", "is", "was", "are", "were", "been",
-        "be", "have", "has", "had", "do", "does", "did", "will", "would",
-        "could", "should", "may", "might", "must", "shall", "can", "need",
-        "this", "that", "these", "those", "it", "its", "their", "our", "your",
-        "new", "announces", "released", "says", "reports", "today", "week",
-    }
-
     # Clean text
-    text = re.sub(r"[^\w\s]", " ", text.lower())
+    text = _NONWORD_RE.sub(" ", text.lower())
     words = text.split()
 
     # Filter stop words and short words
-    keywords = [w for w in words if w not in stop_words and len(w) > 2]
+    keywords = [w for w in words if w not in _STOPWORDS and len(w) > 2]
 
     # Return top N unique words
     seen = set()
@@ -186,25 +302,48 @@ def find_fallback_image(
 
     logger.info("fallback_image_search", query=query)
 
-    # Try Pexels first (more generous rate limit)
-    if pexels_key:
+    def _search_pexels(fetch_bytes: bool = False) -> Optional[dict]:
         try:
-            pexels = PexelsClient(pexels_key)
-            result = pexels.search(query)
-            if result:
-                return result
+            return _get_pexels(pexels_key).search(query, fetch_bytes=fetch_bytes)
         except Exception as e:
             logger.warning("pexels_fallback_error", error=str(e))
+            return None
 
-    # Try Unsplash
-    if unsplash_key:
+    def _search_unsplash(fetch_bytes: bool = False) -> Optional[dict]:
         try:
-            unsplash = UnsplashClient(unsplash_key)
-            result = unsplash.search(query)
-            if result:
-                return result
+            return _get_unsplash(unsplash_key).search(query, fetch_bytes=fetch_bytes)
         except Exception as e:
             logger.warning("unsplash_fallback_error", error=str(e))
+            return None
+
+    result = None
+    if pexels_key and unsplash_key:
+        # Search both providers in parallel; Pexels still wins when both
+        # hit (more generous rate limit), but a Pexels miss no longer
+        # costs a serialized second round trip. The searches return
+        # metadata only - the image body is fetched below for just the
+        # winner, on that client's still-warm session, instead of
+        # downloading both candidates and discarding the loser's bytes
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pexels_future = executor.submit(_search_pexels)
+            unsplash_future = executor.submit(_search_unsplash)
+            result = pexels_future.result()
+            winner = _get_pexels(pexels_key) if result else None
+            if result is None:
+                result = unsplash_future.result()
+                winner = _get_unsplash(unsplash_key) if result else None
+        if result and result.get("url"):
+            try:
+                result["_bytes"] = fetch_image_bytes(winner.session, result["url"])
+            except Exception as e:
+                logger.warning("fallback_prefetch_error", error=str(e))
+    elif pexels_key:
+        result = _search_pexels(fetch_bytes=True)
+    elif unsplash_key:
+        result = _search_unsplash(fetch_bytes=True)
+
+    if result:
+        return result
 
     logger.warning("no_fallback_image_found", query=query)
     return None
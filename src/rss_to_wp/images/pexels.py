@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
-import time
 from typing import Optional
 
 import requests
 
-from rss_to_wp.utils import get_logger
+from rss_to_wp.images.providers import build_image_result, fetch_image_bytes, pick_image_url
+from rss_to_wp.storage.cache import SearchCache, get_search_cache
+from rss_to_wp.utils import TokenBucket, create_http_session, get_logger, json_loads
 
 logger = get_logger("images.pexels")
 
+# Preferred size keys in Pexels "src" maps
+_SIZE_ORDER = ("large", "medium")
+
+# Shared across all client instances and threads - 2 req/s sustained
+# with a burst of 2, matching the old 0.5s minimum interval
+_bucket = TokenBucket(rate=2.0, capacity=2.0)
+
 
 class PexelsClient:
     """Client for Pexels image search API."""
@@ -24,25 +32,23 @@ class PexelsClient:
             api_key: Pexels API key.
         """
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = create_http_session()  # Pooled, keep-alive across searches
         self.session.headers.update({
             "Authorization": api_key,
         })
-        self._last_request_time = 0.0
+        # Built once - every request passes the same timeout
+        self._get_kwargs = {"timeout": (10, 30)}
 
     def _rate_limit(self) -> None:
-        """Ensure we don't exceed rate limits."""
-        min_interval = 0.5  # 2 requests per second max
-        elapsed = time.time() - self._last_request_time
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self._last_request_time = time.time()
+        """Ensure we don't exceed rate limits (shared token bucket)."""
+        _bucket.acquire()
 
     def search(
         self,
         query: str,
         per_page: int = 5,
         orientation: str = "landscape",
+        fetch_bytes: bool = False,
     ) -> Optional[dict]:
         """Search for images on Pexels.
 
@@ -50,15 +56,26 @@ class PexelsClient:
             query: Search query string.
             per_page: Number of results to fetch.
             orientation: Image orientation (landscape, portrait, square).
+            fetch_bytes: Also fetch the image body on the same keep-alive
+                session and attach it as "_bytes".
 
         Returns:
             Dictionary with image URL and attribution, or None.
         """
-        self._rate_limit()
-
         # Clean up query - remove special characters
         clean_query = " ".join(query.split()[:5])  # Max 5 words
 
+        cache = get_search_cache()
+        cache_key = SearchCache.make_key("pexels", clean_query, orientation)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("pexels_search_cached", query=clean_query)
+            if fetch_bytes and cached.get("url"):
+                cached["_bytes"] = fetch_image_bytes(self.session, cached["url"])
+            return cached
+
+        self._rate_limit()
+
         logger.info("pexels_search", query=clean_query)
 
         try:
@@ -69,10 +86,10 @@ class PexelsClient:
                     "per_page": per_page,
                     "orientation": orientation,
                 },
-                timeout=(10, 30),
+                **self._get_kwargs,
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             if not data.get("photos"):
                 logger.info("pexels_no_results", query=clean_query)
@@ -81,18 +98,16 @@ class PexelsClient:
             # Get first photo
             photo = data["photos"][0]
 
-            # Get best size - prefer large
-            image_url = photo["src"].get("large") or photo["src"].get("medium")
+            image_url = pick_image_url(photo["src"], _SIZE_ORDER)
             photographer = photo.get("photographer", "Unknown")
 
-            result = {
-                "url": image_url,
-                "photographer": photographer,
-                "source": "Pexels",
-                "alt_text": f"Photo by {photographer} on Pexels",
-                "photo_id": photo.get("id"),
-                "photographer_url": photo.get("photographer_url", ""),
-            }
+            result = build_image_result(
+                image_url,
+                photographer,
+                "Pexels",
+                photo_id=photo.get("id"),
+                photographer_url=photo.get("photographer_url", ""),
+            )
 
             logger.info(
                 "pexels_image_found",
@@ -100,6 +115,13 @@ class PexelsClient:
                 photographer=photographer,
             )
 
+            cache.set(cache_key, result)
+
+            # Pipeline the bytes fetch on the still-warm connection
+            # (after caching - the cache stores only the metadata)
+            if fetch_bytes and image_url:
+                result["_bytes"] = fetch_image_bytes(self.session, image_url)
+
             return result
 
         except requests.exceptions.HTTPError as e:
@@ -129,25 +151,20 @@ class PexelsClient:
             response = self.session.get(
                 f"{self.BASE_URL}/curated",
                 params={"per_page": per_page},
-                timeout=(10, 30),
+                **self._get_kwargs,
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             if not data.get("photos"):
                 return None
 
             # Get first photo
             photo = data["photos"][0]
-            image_url = photo["src"].get("large") or photo["src"].get("medium")
+            image_url = pick_image_url(photo["src"], _SIZE_ORDER)
             photographer = photo.get("photographer", "Unknown")
 
-            return {
-                "url": image_url,
-                "photographer": photographer,
-                "source": "Pexels",
-                "alt_text": f"Photo by {photographer} on Pexels",
-            }
+            return build_image_result(image_url, photographer, "Pexels")
 
         except Exception as e:
             logger.error("pexels_curated_error", error=str(e))
@@ -0,0 +1,88 @@
+"""Shared helpers for image provider clients."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import requests
+
+# Provider CDN images are modest, but cap reads defensively
+_MAX_FETCH_BYTES = 5 * 1024 * 1024
+
+
+def pick_image_url(sizes: dict, size_order: tuple[str, ...]) -> Optional[str]:
+    """Pick the first available image URL from a size dict.
+
+    Args:
+        sizes: Provider size map (e.g. Pexels ``src``, Unsplash ``urls``).
+        size_order: Size keys in order of preference.
+
+    Returns:
+        First non-empty URL, or None.
+    """
+    for key in size_order:
+        url = sizes.get(key)
+        if url:
+            return url
+    return None
+
+
+def build_image_result(
+    image_url: Optional[str],
+    photographer: str,
+    source: str,
+    **extra: object,
+) -> dict:
+    """Build the standard attribution dict returned by provider searches.
+
+    Args:
+        image_url: Chosen image URL.
+        photographer: Photographer name for attribution.
+        source: Provider name (e.g. "Pexels", "Unsplash").
+        **extra: Additional provider-specific keys to include.
+
+    Returns:
+        Result dict with url, photographer, source and alt_text keys.
+    """
+    result = {
+        "url": image_url,
+        "photographer": photographer,
+        "source": source,
+        "alt_text": f"Photo by {photographer} on {source}",
+    }
+    if extra:
+        result.update(extra)
+    return result
+
+
+def fetch_image_bytes(
+    session: requests.Session,
+    url: str,
+    timeout: tuple[int, int] = (10, 30),
+) -> Optional[bytes]:
+    """Fetch image bytes over an existing keep-alive session.
+
+    Reuses the socket the search response just came in on, so the
+    download skips a fresh TCP+TLS handshake to the provider CDN.
+
+    Args:
+        session: Pooled session from the provider client.
+        url: Image URL to fetch.
+        timeout: Request timeout (connect, read).
+
+    Returns:
+        Image bytes, or None on failure or oversize response.
+    """
+    try:
+        response = session.get(url, stream=True, timeout=timeout)
+        response.raise_for_status()
+
+        buffer = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            buffer.extend(chunk)
+            if len(buffer) > _MAX_FETCH_BYTES:
+                response.close()
+                return None
+        return bytes(buffer)
+    except requests.exceptions.RequestException:
+        return None
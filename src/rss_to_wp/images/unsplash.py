@@ -2,15 +2,27 @@
 
 from __future__ import annotations
 
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import requests
 
-from rss_to_wp.utils import get_logger
+from rss_to_wp.images.providers import build_image_result, fetch_image_bytes, pick_image_url
+from rss_to_wp.storage.cache import SearchCache, get_search_cache
+from rss_to_wp.utils import TokenBucket, create_http_session, get_logger, json_loads
 
 logger = get_logger("images.unsplash")
 
+# Preferred size keys in Unsplash "urls" maps
+_SIZE_ORDER = ("regular", "small")
+
+# Shared across all client instances and threads - 1 req/s, matching the
+# old 1s minimum interval (free tier allows 50/hour)
+_bucket = TokenBucket(rate=1.0, capacity=1.0)
+
+# Fire-and-forget pool for download tracking pings
+_tracker = ThreadPoolExecutor(max_workers=2, thread_name_prefix="unsplash-track")
+
 
 class UnsplashClient:
     """Client for Unsplash image search API."""
@@ -24,26 +36,24 @@ class UnsplashClient:
             access_key: Unsplash access key.
         """
         self.access_key = access_key
-        self.session = requests.Session()
+        self.session = create_http_session()  # Pooled, keep-alive across searches
         self.session.headers.update({
             "Authorization": f"Client-ID {access_key}",
             "Accept-Version": "v1",
         })
-        self._last_request_time = 0.0
+        # Built once - every request passes the same timeout
+        self._get_kwargs = {"timeout": (10, 30)}
 
     def _rate_limit(self) -> None:
-        """Ensure we don't exceed rate limits (50/hour for free tier)."""
-        min_interval = 1.0  # 1 request per second max
-        elapsed = time.time() - self._last_request_time
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self._last_request_time = time.time()
+        """Ensure we don't exceed rate limits (shared token bucket)."""
+        _bucket.acquire()
 
     def search(
         self,
         query: str,
         per_page: int = 5,
         orientation: str = "landscape",
+        fetch_bytes: bool = False,
     ) -> Optional[dict]:
         """Search for images on Unsplash.
 
@@ -51,15 +61,28 @@ class UnsplashClient:
             query: Search query string.
             per_page: Number of results to fetch.
             orientation: Image orientation (landscape, portrait, squarish).
+            fetch_bytes: Also fetch the image body on the same keep-alive
+                session and attach it as "_bytes".
 
         Returns:
             Dictionary with image URL and attribution, or None.
         """
-        self._rate_limit()
-
         # Clean up query - remove special characters
         clean_query = " ".join(query.split()[:5])  # Max 5 words
 
+        cache = get_search_cache()
+        cache_key = SearchCache.make_key("unsplash", clean_query, orientation)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            logger.info("unsplash_search_cached", query=clean_query)
+            # Unsplash guidelines still require a tracking ping per use
+            self._track_download({"links": {"download_location": cached.get("download_location")}})
+            if fetch_bytes and cached.get("url"):
+                cached["_bytes"] = fetch_image_bytes(self.session, cached["url"])
+            return cached
+
+        self._rate_limit()
+
         logger.info("unsplash_search", query=clean_query)
 
         try:
@@ -70,10 +93,10 @@ class UnsplashClient:
                     "per_page": per_page,
                     "orientation": orientation,
                 },
-                timeout=(10, 30),
+                **self._get_kwargs,
             )
             response.raise_for_status()
-            data = response.json()
+            data = json_loads(response.content)
 
             if not data.get("results"):
                 logger.info("unsplash_no_results", query=clean_query)
@@ -83,20 +106,19 @@ class UnsplashClient:
             photo = data["results"][0]
 
             # Get regular size (1080px width)
-            image_url = photo["urls"].get("regular") or photo["urls"].get("small")
-            photographer = photo.get("user", {}).get("name", "Unknown")
-            photographer_username = photo.get("user", {}).get("username", "")
+            user = photo.get("user", {})
+            image_url = pick_image_url(photo["urls"], _SIZE_ORDER)
+            photographer = user.get("name", "Unknown")
 
             # Unsplash requires attribution with link
-            result = {
-                "url": image_url,
-                "photographer": photographer,
-                "source": "Unsplash",
-                "alt_text": f"Photo by {photographer} on Unsplash",
-                "photo_id": photo.get("id"),
-                "photographer_url": f"https://unsplash.com/@{photographer_username}",
-                "download_location": photo.get("links", {}).get("download_location"),
-            }
+            result = build_image_result(
+                image_url,
+                photographer,
+                "Unsplash",
+                photo_id=photo.get("id"),
+                photographer_url=f"https://unsplash.com/@{user.get('username', '')}",
+                download_location=photo.get("links", {}).get("download_location"),
+            )
 
             logger.info(
                 "unsplash_image_found",
@@ -107,6 +129,13 @@ class UnsplashClient:
             # Trigger download tracking (required by Unsplash API guidelines)
             self._track_download(photo)
 
+            cache.set(cache_key, result)
+
+            # Pipeline the bytes fetch on the still-warm connection
+            # (after caching - the cache stores only the metadata)
+            if fetch_bytes and image_url:
+                result["_bytes"] = fetch_image_bytes(self.session, image_url)
+
             return result
 
         except requests.exceptions.HTTPError as e:
@@ -122,6 +151,10 @@ class UnsplashClient:
     def _track_download(self, photo: dict) -> None:
         """Track download as required by Unsplash API.
 
+        The ping is best-effort and its result is never used, so it runs
+        in the background on the same keep-alive session instead of
+        blocking the search return by a full round trip.
+
         Args:
             photo: Photo data from search results.
         """
@@ -129,11 +162,14 @@ class UnsplashClient:
         if not download_url:
             return
 
-        try:
-            # This doesn't actually download, just tracks
-            self.session.get(download_url, timeout=(5, 10))
-        except Exception:
-            pass  # Best effort, don't fail on tracking errors
+        def _ping() -> None:
+            try:
+                # This doesn't actually download, just tracks
+                self.session.get(download_url, timeout=(5, 10))
+            except Exception:
+                pass  # Best effort, don't fail on tracking errors
+
+        _tracker.submit(_ping)
 
     def get_random(self, query: Optional[str] = None) -> Optional[dict]:
         """Get a random photo.
@@ -156,20 +192,15 @@ class UnsplashClient:
             response = self.session.get(
                 f"{self.BASE_URL}/photos/random",
                 params=params,
-                timeout=(10, 30),
+                **self._get_kwargs,
             )
             response.raise_for_status()
-            photo = response.json()
+            photo = json_loads(response.content)
 
-            image_url = photo["urls"].get("regular") or photo["urls"].get("small")
+            image_url = pick_image_url(photo["urls"], _SIZE_ORDER)
             photographer = photo.get("user", {}).get("name", "Unknown")
 
-            return {
-                "url": image_url,
-                "photographer": photographer,
-                "source": "Unsplash",
-                "alt_text": f"Photo by {photographer} on Unsplash",
-            }
+            return build_image_result(image_url, photographer, "Unsplash")
 
         except Exception as e:
             logger.error("unsplash_random_error", error=str(e))
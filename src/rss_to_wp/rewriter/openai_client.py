@@ -2,19 +2,65 @@
 
 from __future__ import annotations
 
-import json
 import re
-import time
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 
-from openai import OpenAI
-
-from rss_to_wp.utils import get_logger
+from bs4 import BeautifulSoup
+from openai import APIConnectionError, APITimeoutError, OpenAI, RateLimitError
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from rss_to_wp.utils import TokenBudgetTracker, get_logger, json_loads
+
+try:
+    # Optional - exact token counts for budgeting; the chars/4 estimate
+    # is close enough when it's missing
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+try:
+    # lxml's C parser is an order of magnitude faster than html.parser
+    # on the long content blobs feeds embed
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 
 logger = get_logger("rewriter.openai")
 
-# System prompt for AP-style rewriting
-AP_STYLE_PROMPT = """You are a professional news editor who rewrites press releases and articles into AP (Associated Press) style news articles.
+# Compiled once - these run per article, before any network call
+_WS_RE = re.compile(r"\s+")
+_TAG_RE = re.compile(r"<[^>]+>")
+_JSON_OBJ_RE = re.compile(r"\{[\s\S]*\}")
+
+
+@lru_cache(maxsize=4)
+def _get_encoder(model: str):
+    """Get a tiktoken encoder for the model, or None if unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except Exception:
+        # Unknown model name, or the BPE data couldn't be fetched
+        try:
+            return tiktoken.get_encoding("o200k_base")
+        except Exception:
+            return None
+
+# System prompt for AP-style rewriting. Interned so every request body
+# references the single canonical string object - the prompt must stay
+# byte-identical across calls for the API's prefix cache to hit.
+AP_STYLE_PROMPT = sys.intern("""You are a professional news editor who rewrites press releases and articles into AP (Associated Press) style news articles.
 
 RULES:
 1. Write in objective, third-person voice
@@ -41,7 +87,24 @@ IMPORTANT:
 - Use <p> tags to wrap each paragraph
 - Do NOT include the headline in the body
 - Do NOT include any markdown - use HTML only
-"""
+
+The user message will contain the original title and content. Rewrite it
+into AP style and respond with valid JSON containing headline, excerpt,
+and body.
+
+EXAMPLE INPUT:
+ORIGINAL TITLE: Acme Corp Unveils Revolutionary New Widget That Will Change Everything!!!
+
+ORIGINAL CONTENT:
+Acme Corp, the leading innovator in widget technology, is thrilled to announce the launch of its groundbreaking WidgetPro 3000. "This is a game-changer for the entire industry," said CEO Jane Smith. The device will be available nationwide starting March 15 at a suggested retail price of $199. Analysts at Widget Insights project the market could reach $2 billion by 2027.
+
+EXAMPLE OUTPUT:
+{
+    "headline": "Acme Corp to Launch WidgetPro 3000 Nationwide in March",
+    "excerpt": "Acme Corp will release its WidgetPro 3000 nationwide on March 15 at a suggested price of $199.",
+    "body": "<p>Acme Corp announced it will launch the WidgetPro 3000 nationwide on March 15.</p><p>The device will carry a suggested retail price of $199, the company said.</p><p>\\"This is a game-changer for the entire industry,\\" CEO Jane Smith said in a statement.</p><p>Analysts at Widget Insights project the widget market could reach $2 billion by 2027.</p>"
+}
+""")
 
 
 class OpenAIRewriter:
@@ -53,6 +116,11 @@ class OpenAIRewriter:
         model: str = "gpt-5-mini",
         fallback_model: str = "gpt-4.1-nano",
         max_tokens: int = 2000,
+        max_input_tokens: int = 4000,
+        max_concurrency: int = 4,
+        requests_per_minute: int = 60,
+        tokens_per_minute: int = 200_000,
+        cache_rewrites: bool = True,
     ):
         """Initialize OpenAI rewriter.
 
@@ -61,20 +129,46 @@ class OpenAIRewriter:
             model: Primary model to use (default: gpt-5-mini).
             fallback_model: Fallback model if primary fails (default: gpt-4.1-nano).
             max_tokens: Maximum tokens in response.
+            max_input_tokens: Content token budget before truncation.
+            max_concurrency: Maximum in-flight API calls for rewrite_many.
+            requests_per_minute: API request budget per rolling minute.
+            tokens_per_minute: API token budget per rolling minute.
+            cache_rewrites: Reuse stored rewrites for duplicate content.
         """
-        self.client = OpenAI(api_key=api_key)
+        # SDK-internal retries are disabled - _create_completion's
+        # tenacity policy is the single retry layer, so failures don't
+        # stack two nested backoff loops
+        self.client = OpenAI(api_key=api_key, max_retries=0)
         self.model = model
         self.fallback_model = fallback_model
         self.max_tokens = max_tokens
-        self._last_request_time = 0.0
+        self.max_input_tokens = max_input_tokens
+        self.max_concurrency = max_concurrency
+        self.cache_rewrites = cache_rewrites
+        self._budget = TokenBudgetTracker(requests_per_minute, tokens_per_minute)
+        self._rewrite_cache = None
+
+    def _get_rewrite_cache(self):
+        """Lazily open the on-disk rewrite cache."""
+        if self._rewrite_cache is None:
+            from rss_to_wp.storage.cache import RewriteCache
+
+            self._rewrite_cache = RewriteCache()
+        return self._rewrite_cache
+
+    def _estimate_tokens(self, text: str) -> int:
+        """Estimate the token count of a prompt string.
 
-    def _rate_limit(self) -> None:
-        """Ensure we don't exceed rate limits."""
-        min_interval = 2.0  # 2 seconds between requests
-        elapsed = time.time() - self._last_request_time
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self._last_request_time = time.time()
+        Args:
+            text: Prompt text.
+
+        Returns:
+            Token count (tiktoken when available, chars/4 otherwise).
+        """
+        encoder = _get_encoder(self.model)
+        if encoder is None:
+            return len(text) // 4 + 1
+        return len(encoder.encode(text))
 
     def rewrite(
         self,
@@ -92,8 +186,6 @@ class OpenAIRewriter:
         Returns:
             Dictionary with headline, excerpt, body or None on failure.
         """
-        self._rate_limit()
-
         # Clean HTML from content for better processing
         clean_content = self._strip_html(content)
 
@@ -101,25 +193,52 @@ class OpenAIRewriter:
             logger.warning("content_too_short", length=len(clean_content))
             return None
 
-        # Truncate very long content
-        if len(clean_content) > 10000:
-            clean_content = clean_content[:10000] + "..."
+        # Truncate on token count - characters are a poor proxy for what
+        # the model actually bills and reads
+        encoder = _get_encoder(self.model)
+        if encoder is not None:
+            content_tokens = encoder.encode(clean_content)
+            if len(content_tokens) > self.max_input_tokens:
+                clean_content = encoder.decode(content_tokens[: self.max_input_tokens]) + "..."
+            content_token_count = min(len(content_tokens), self.max_input_tokens)
+        else:
+            # No encoder available - fall back to the character heuristic
+            if len(clean_content) > 10000:
+                clean_content = clean_content[:10000] + "..."
+            content_token_count = len(clean_content) // 4 + 1
+
+        # Syndicated wire stories recur across feeds - reuse the stored
+        # rewrite for identical or near-identical content
+        if self.cache_rewrites:
+            cached = self._get_rewrite_cache().get(clean_content)
+            if cached is not None:
+                logger.info("rewrite_cache_hit", title=original_title[:50])
+                result = dict(cached)
+                if use_original_title:
+                    result["headline"] = original_title
+                return result
 
         logger.info(
             "rewriting_article",
             title=original_title[:50],
             content_length=len(clean_content),
+            content_tokens=content_token_count,
             model=self.model,
         )
 
-        user_prompt = f"""Rewrite the following article into AP style:
-
-ORIGINAL TITLE: {original_title}
+        # All invariant instructions live in the system prompt so the
+        # request shares a byte-identical leading prefix across calls,
+        # qualifying for OpenAI's automatic prompt caching; only the
+        # dynamic fields vary per article
+        user_prompt = f"""ORIGINAL TITLE: {original_title}
 
 ORIGINAL CONTENT:
-{clean_content}
+{clean_content}"""
 
-Remember to respond with valid JSON containing headline, excerpt, and body."""
+        # Budget against both RPM and TPM for prompt plus worst-case output
+        self._budget.await_capacity(
+            self._estimate_tokens(AP_STYLE_PROMPT) + self._estimate_tokens(user_prompt) + self.max_tokens
+        )
 
         # Try primary model first, then fallback
         models_to_try = [self.model]
@@ -133,6 +252,11 @@ Remember to respond with valid JSON containing headline, excerpt, and body."""
                     current_model, user_prompt, original_title, use_original_title
                 )
                 if result:
+                    # Cache only model-produced headlines - a result with
+                    # the original title swapped in would poison hits for
+                    # feeds that want rewritten headlines
+                    if self.cache_rewrites and not use_original_title:
+                        self._get_rewrite_cache().set(clean_content, result)
                     return result
             except Exception as e:
                 last_error = e
@@ -148,6 +272,29 @@ Remember to respond with valid JSON containing headline, excerpt, and body."""
             logger.error("openai_rewrite_error", error=str(last_error))
         return None
 
+    def rewrite_many(
+        self,
+        items: list[tuple[str, str, bool]],
+    ) -> list[Optional[dict]]:
+        """Rewrite a batch of articles concurrently.
+
+        The API calls are network-latency-bound, so overlapping them cuts
+        a batch of N from N sequential round trips to roughly
+        N / max_concurrency. Rate limiting still applies per call.
+
+        Args:
+            items: List of (content, original_title, use_original_title)
+                tuples, as accepted by rewrite().
+
+        Returns:
+            Results in input order; None entries mark failed rewrites.
+        """
+        if not items:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(items))) as executor:
+            return list(executor.map(lambda item: self.rewrite(*item), items))
+
     def _call_openai(
         self,
         model: str,
@@ -174,6 +321,9 @@ Remember to respond with valid JSON containing headline, excerpt, and body."""
                 {"role": "user", "content": user_prompt},
             ],
             "temperature": 0.7,
+            # Stable identifier keeps requests routed to the same prompt
+            # cache shard
+            "user": "rss-to-wp-rewriter",
         }
 
         # Newer models (gpt-4.1, gpt-4o, gpt-5, etc.) use max_completion_tokens
@@ -187,11 +337,35 @@ Remember to respond with valid JSON containing headline, excerpt, and body."""
         if "o1" not in model.lower():
             api_params["response_format"] = {"type": "json_object"}
 
+        # Stream the completion - tokens are consumed as they're
+        # generated instead of blocking until the last one lands, and a
+        # dropped connection surfaces immediately rather than after the
+        # full completion window
+        api_params["stream"] = True
+        api_params["stream_options"] = {"include_usage": True}
+
         logger.info("calling_openai", model=model)
-        response = self.client.chat.completions.create(**api_params)
+        stream = self._create_completion(api_params)
+
+        parts: list[str] = []
+        usage = None
+        for chunk in stream:
+            if chunk.choices:
+                delta = getattr(chunk.choices[0].delta, "content", None)
+                if delta:
+                    parts.append(delta)
+            # The final chunk carries usage when include_usage is set
+            if getattr(chunk, "usage", None) is not None:
+                usage = chunk.usage
+        response_text = "".join(parts)
+
+        # Surface how much of the prompt hit OpenAI's prefix cache
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached_tokens = getattr(details, "cached_tokens", 0)
+        if cached_tokens:
+            logger.debug("prompt_cache_hit", model=model, cached_tokens=cached_tokens)
 
         # Parse response
-        response_text = response.choices[0].message.content
         result = self._parse_response(response_text)
 
         if result:
@@ -210,6 +384,24 @@ Remember to respond with valid JSON containing headline, excerpt, and body."""
 
         return None
 
+    @retry(
+        retry=retry_if_exception_type((RateLimitError, APIConnectionError, APITimeoutError)),
+        wait=wait_exponential_jitter(initial=1, max=60),
+        stop=stop_after_attempt(6),
+        reraise=True,
+    )
+    def _create_completion(self, api_params: dict):
+        """Call the completions endpoint, backing off on 429s and
+        transient transport failures.
+
+        Args:
+            api_params: Keyword arguments for chat.completions.create.
+
+        Returns:
+            The API response.
+        """
+        return self.client.chat.completions.create(**api_params)
+
     def _parse_response(self, response_text: str) -> Optional[dict]:
         """Parse the JSON response from OpenAI.
 
@@ -220,7 +412,7 @@ Remember to respond with valid JSON containing headline, excerpt, and body."""
             Parsed dictionary or None.
         """
         try:
-            data = json.loads(response_text)
+            data = json_loads(response_text)
 
             # Validate required fields
             if not all(k in data for k in ["headline", "body"]):
@@ -233,7 +425,8 @@ Remember to respond with valid JSON containing headline, excerpt, and body."""
                 "body": data["body"].strip(),
             }
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # Covers both stdlib json.JSONDecodeError and orjson's
             logger.warning("json_parse_error", error=str(e), response=response_text[:200])
 
             # Try to extract from malformed response
@@ -250,9 +443,9 @@ Remember to respond with valid JSON containing headline, excerpt, and body."""
         """
         try:
             # Try to find JSON-like content
-            json_match = re.search(r"\{[\s\S]*\}", text)
+            json_match = _JSON_OBJ_RE.search(text)
             if json_match:
-                return json.loads(json_match.group())
+                return json_loads(json_match.group())
         except Exception:
             pass
 
@@ -268,29 +461,54 @@ Remember to respond with valid JSON containing headline, excerpt, and body."""
         Returns:
             Plain text content.
         """
-        from bs4 import BeautifulSoup
+        return _strip_html(html)
 
-        try:
-            soup = BeautifulSoup(html, "html.parser")
 
-            # Remove script and style elements
-            for element in soup(["script", "style", "nav", "footer", "header"]):
-                element.decompose()
+# Only cache typical article bodies - multi-MB pages would pin too much
+# memory in the LRU
+_STRIP_CACHE_MAX_LEN = 200_000
 
-            # Get text
-            text = soup.get_text(separator=" ")
 
-            # Clean up whitespace
-            text = re.sub(r"\s+", " ", text)
-            text = text.strip()
+def _strip_html_uncached(html: str) -> str:
+    """Strip tags and normalize whitespace in HTML content."""
+    try:
+        soup = BeautifulSoup(html, HTML_PARSER)
 
-            return text
+        # Remove script and style elements
+        for element in soup(["script", "style", "nav", "footer", "header"]):
+            element.decompose()
 
-        except Exception:
-            # Fallback: simple regex
-            text = re.sub(r"<[^>]+>", " ", html)
-            text = re.sub(r"\s+", " ", text)
-            return text.strip()
+        # Get text
+        text = soup.get_text(separator=" ")
+
+        # Clean up whitespace
+        return _WS_RE.sub(" ", text).strip()
+
+    except Exception:
+        # Fallback: simple regex
+        text = _TAG_RE.sub(" ", html)
+        return _WS_RE.sub(" ", text).strip()
+
+
+_strip_html_cached = lru_cache(maxsize=512)(_strip_html_uncached)
+
+
+def _strip_html(html: str) -> str:
+    """Strip HTML, reusing cached results for repeated content.
+
+    The same article body recurs within a run (syndication across
+    feeds, retries), and parsing is the most CPU-expensive step before
+    the network call - repeats cost a dict lookup instead.
+
+    Args:
+        html: HTML content.
+
+    Returns:
+        Plain text content.
+    """
+    if len(html) > _STRIP_CACHE_MAX_LEN:
+        return _strip_html_uncached(html)
+    return _strip_html_cached(html)
 
 
 def rewrite_with_openai(
@@ -0,0 +1,399 @@
+"""On-disk TTL caches for expensive external calls."""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from rss_to_wp.config import get_data_dir
+from rss_to_wp.utils import get_logger, json_dumps, json_loads
+
+logger = get_logger("storage.cache")
+
+# One day - stock search results for a keyword are stable enough to reuse
+DEFAULT_TTL = 86400.0
+
+
+class SearchCache:
+    """SQLite-backed cache for provider search results.
+
+    Feed titles repeat keywords (brand and topic names), so the same
+    Pexels/Unsplash query recurs across entries and across runs. Caching
+    the search result on disk skips the whole HTTPS round trip plus the
+    rate-limit wait on a hit.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, ttl: float = DEFAULT_TTL):
+        """Initialize the search cache.
+
+        Args:
+            db_path: Path to SQLite database. Defaults to data/search_cache.db
+            ttl: Seconds before a cached result expires.
+        """
+        if db_path is None:
+            db_path = get_data_dir() / "search_cache.db"
+
+        self.db_path = db_path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize the database schema."""
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_results (
+                    cache_key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+
+    @contextmanager
+    def _get_connection(self):
+        """Get a database connection context manager."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def get(self, cache_key: str) -> Optional[dict]:
+        """Look up a cached result.
+
+        Args:
+            cache_key: Key as built by make_key().
+
+        Returns:
+            Cached result dict, or None on miss or expiry.
+        """
+        with self._lock, self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT result, created_at FROM search_results WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        result, created_at = row
+        if time.time() - created_at > self.ttl:
+            return None
+
+        logger.debug("search_cache_hit", key=cache_key)
+        return json_loads(result)
+
+    def set(self, cache_key: str, result: dict) -> None:
+        """Store a search result.
+
+        Args:
+            cache_key: Key as built by make_key().
+            result: JSON-serializable result dict.
+        """
+        with self._lock, self._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO search_results (cache_key, result, created_at)
+                VALUES (?, ?, ?)
+                ON CONFLICT(cache_key) DO UPDATE SET
+                    result = excluded.result,
+                    created_at = excluded.created_at
+                """,
+                (cache_key, json_dumps(result), time.time()),
+            )
+            conn.commit()
+
+    @staticmethod
+    def make_key(provider: str, query: str, orientation: str) -> str:
+        """Build a cache key from the search parameters.
+
+        Args:
+            provider: Provider name (e.g. "pexels").
+            query: Cleaned search query.
+            orientation: Requested image orientation.
+
+        Returns:
+            Normalized cache key string.
+        """
+        return f"{provider}:{query.lower()}:{orientation}"
+
+
+def _simhash(text: str) -> int:
+    """Compute a 64-bit SimHash over word 3-shingles.
+
+    Near-duplicate texts (syndicated copies with minor edits) land
+    within a few bits of each other, so Hamming distance gives a cheap
+    similarity test without embeddings or external dependencies.
+
+    Args:
+        text: Normalized text to fingerprint.
+
+    Returns:
+        64-bit fingerprint integer.
+    """
+    words = text.split()
+    if len(words) < 3:
+        shingles = words or [text]
+    else:
+        shingles = (" ".join(words[i : i + 3]) for i in range(len(words) - 2))
+
+    weights = [0] * 64
+    for shingle in shingles:
+        h = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), "big")
+        for bit in range(64):
+            if (h >> bit) & 1:
+                weights[bit] += 1
+            else:
+                weights[bit] -= 1
+
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+_SIMHASH_MASK = (1 << 64) - 1
+
+
+def _to_signed64(value: int) -> int:
+    """Map an unsigned 64-bit value into SQLite's signed INTEGER range."""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+class RewriteCache:
+    """Cache of model rewrites keyed by article content.
+
+    RSS aggregation resurfaces the same wire-service story across feeds,
+    and re-runs revisit articles already rewritten. An exact hit on the
+    normalized content hash, or a near hit on the SimHash fingerprint,
+    returns the stored rewrite in milliseconds instead of paying the
+    model call's latency and token spend again.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl: float = 7 * 86400,
+        max_hamming: int = 6,
+    ):
+        """Initialize the rewrite cache.
+
+        Args:
+            db_path: Path to SQLite database. Defaults to data/processed.db
+                (shared with DedupeStore to avoid a second DB file).
+            ttl: Seconds before a cached rewrite expires.
+            max_hamming: Maximum SimHash Hamming distance counted as a hit.
+        """
+        if db_path is None:
+            db_path = get_data_dir() / "processed.db"
+
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_hamming = max_hamming
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize the database schema."""
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS rewrite_cache (
+                    content_key TEXT PRIMARY KEY,
+                    simhash INTEGER NOT NULL,
+                    result TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """)
+            conn.commit()
+
+    @contextmanager
+    def _get_connection(self):
+        """Get a database connection context manager."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _fingerprint(content: str) -> tuple[str, int]:
+        """Build the exact key and SimHash for a content string."""
+        normalized = " ".join(content.lower().split())
+        key = hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+        return key, _simhash(normalized)
+
+    def get(self, content: str) -> Optional[dict]:
+        """Look up a cached rewrite for this content.
+
+        Args:
+            content: Stripped article text, as passed to the model.
+
+        Returns:
+            Cached rewrite dict, or None on miss or expiry.
+        """
+        key, fingerprint = self._fingerprint(content)
+        cutoff = time.time() - self.ttl
+
+        with self._lock, self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT result FROM rewrite_cache WHERE content_key = ? AND created_at > ?",
+                (key, cutoff),
+            ).fetchone()
+            if row is not None:
+                logger.debug("rewrite_cache_exact_hit", key=key)
+                return json_loads(row[0])
+
+            # Near-duplicate scan - row count stays modest under the TTL
+            for simhash, result in conn.execute(
+                "SELECT simhash, result FROM rewrite_cache WHERE created_at > ?",
+                (cutoff,),
+            ):
+                if ((simhash ^ fingerprint) & _SIMHASH_MASK).bit_count() <= self.max_hamming:
+                    logger.debug("rewrite_cache_near_hit", key=key)
+                    return json_loads(result)
+
+        return None
+
+    def set(self, content: str, result: dict) -> None:
+        """Store a rewrite result.
+
+        Args:
+            content: Stripped article text the rewrite was produced from.
+            result: Rewrite dict (headline, excerpt, body).
+        """
+        key, fingerprint = self._fingerprint(content)
+        with self._lock, self._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO rewrite_cache (content_key, simhash, result, created_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(content_key) DO UPDATE SET
+                    simhash = excluded.simhash,
+                    result = excluded.result,
+                    created_at = excluded.created_at
+                """,
+                (key, _to_signed64(fingerprint), json_dumps(result), time.time()),
+            )
+            conn.commit()
+
+
+class TaxonomyCache:
+    """On-disk map of WordPress taxonomy term IDs, keyed by site.
+
+    Category and tag IDs are stable, but the in-memory client caches
+    start cold on every CLI run, so steady-state runs re-resolve the
+    same handful of slugs over HTTP. Persisting the name->id maps makes
+    the taxonomy prelude free after the first run. Entries expire after
+    30 days so a rebuilt site eventually self-heals.
+    """
+
+    DEFAULT_TTL = 30 * 86400.0
+
+    def __init__(self, db_path: Optional[Path] = None, ttl: float = DEFAULT_TTL):
+        """Initialize the taxonomy cache.
+
+        Args:
+            db_path: Path to SQLite database. Defaults to data/search_cache.db
+                (shared with SearchCache to avoid another DB file).
+            ttl: Seconds before a cached term ID expires.
+        """
+        if db_path is None:
+            db_path = get_data_dir() / "search_cache.db"
+
+        self.db_path = db_path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Initialize the database schema."""
+        with self._get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS taxonomy_terms (
+                    site TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    term_id INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (site, kind, name)
+                )
+            """)
+            conn.commit()
+
+    @contextmanager
+    def _get_connection(self):
+        """Get a database connection context manager."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def load(self, site: str, kind: str) -> dict[str, int]:
+        """Load all unexpired term IDs for a site and taxonomy kind.
+
+        Args:
+            site: WordPress base URL.
+            kind: Taxonomy kind ("category" or "tag").
+
+        Returns:
+            Mapping of term name to term ID.
+        """
+        cutoff = time.time() - self.ttl
+        with self._lock, self._get_connection() as conn:
+            rows = conn.execute(
+                "SELECT name, term_id FROM taxonomy_terms"
+                " WHERE site = ? AND kind = ? AND created_at > ?",
+                (site, kind, cutoff),
+            ).fetchall()
+        return dict(rows)
+
+    def set(self, site: str, kind: str, name: str, term_id: int) -> None:
+        """Store one resolved term ID.
+
+        Args:
+            site: WordPress base URL.
+            kind: Taxonomy kind ("category" or "tag").
+            name: Term name as configured.
+            term_id: Resolved WordPress term ID.
+        """
+        with self._lock, self._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO taxonomy_terms (site, kind, name, term_id, created_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(site, kind, name) DO UPDATE SET
+                    term_id = excluded.term_id,
+                    created_at = excluded.created_at
+                """,
+                (site, kind, name, term_id, time.time()),
+            )
+            conn.commit()
+
+
+_shared_cache: Optional[SearchCache] = None
+_shared_taxonomy: Optional[TaxonomyCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchCache:
+    """Get the process-wide shared search cache."""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = SearchCache()
+    return _shared_cache
+
+
+def get_taxonomy_cache() -> TaxonomyCache:
+    """Get the process-wide shared taxonomy cache."""
+    global _shared_taxonomy
+    if _shared_taxonomy is None:
+        with _shared_lock:
+            if _shared_taxonomy is None:
+                _shared_taxonomy = TaxonomyCache()
+    return _shared_taxonomy
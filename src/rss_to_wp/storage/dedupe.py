@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import hashlib
+import math
+import pickle
 import sqlite3
+import threading
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
@@ -14,6 +18,65 @@ from rss_to_wp.utils import get_logger
 logger = get_logger("storage.dedupe")
 
 
+class _BloomFilter:
+    """Minimal Bloom filter for fast negative membership checks.
+
+    A miss means the key is definitely absent; a hit must be confirmed
+    against the authoritative store. Uses double hashing over a single
+    BLAKE2b digest, so no extra dependencies. Thread-safe.
+    """
+
+    def __init__(self, capacity: int = 100_000, error_rate: float = 1e-4):
+        # Standard sizing: m = -n*ln(p)/ln(2)^2, k = (m/n)*ln(2)
+        num_bits = max(64, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._num_bits = num_bits
+        self._num_hashes = max(1, round((num_bits / capacity) * math.log(2)))
+        self._bits = bytearray((num_bits + 7) // 8)
+        self._lock = threading.Lock()
+
+    def _positions(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1  # Odd so strides cover the table
+        return [(h1 + i * h2) % self._num_bits for i in range(self._num_hashes)]
+
+    def add(self, key: str) -> None:
+        with self._lock:
+            for pos in self._positions(key):
+                self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def to_state(self) -> dict:
+        """Snapshot the filter as plain primitives for pickling."""
+        with self._lock:
+            return {
+                "num_bits": self._num_bits,
+                "num_hashes": self._num_hashes,
+                "bits": bytes(self._bits),
+            }
+
+    @classmethod
+    def from_state(cls, state: dict) -> "_BloomFilter":
+        """Rebuild a filter from a to_state() snapshot."""
+        bloom = cls()
+        bloom._num_bits = state["num_bits"]
+        bloom._num_hashes = state["num_hashes"]
+        bloom._bits = bytearray(state["bits"])
+        return bloom
+
+
+def _hash_key(entry_key: str) -> bytes:
+    """Hash an entry key to the fixed-width form stored in SQLite.
+
+    Fixed 16-byte BLOB keys keep the primary-key B-tree compact and make
+    comparisons a constant-size memcmp instead of variable-length string
+    compares over full URLs/GUIDs.
+    """
+    return hashlib.blake2b(entry_key.encode("utf-8"), digest_size=16).digest()
+
+
 class DedupeStore:
     """SQLite-based store for tracking processed entries."""
 
@@ -27,44 +90,210 @@ class DedupeStore:
             db_path = get_data_dir() / "processed.db"
 
         self.db_path = db_path
+        self._bloom_path = Path(f"{db_path}.bloom")
+        self._local = threading.local()  # Per-thread write batch (see transaction)
+        self._db_lock = threading.RLock()  # Serializes use of the shared connection
+        self._conn = self._open_connection()
         self._init_db()
+        self._bloom = self._build_bloom()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open the single persistent connection used for the store's life.
+
+        Opening per operation paid a connect syscall and a cold page
+        cache on every membership check; one long-lived connection keeps
+        SQLite's page and statement caches warm across the whole run.
+        """
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        # WAL keeps readers and the writer from blocking each other;
+        # synchronous=NORMAL drops the per-commit fsync (safe under WAL)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+        return conn
+
+    def close(self) -> None:
+        """Persist the Bloom filter and close the connection."""
+        with self._db_lock:
+            if self._conn is not None:
+                self._save_bloom()
+                self._conn.close()
+                self._conn = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _build_bloom(self) -> _BloomFilter:
+        """Load or rebuild the in-memory Bloom filter.
+
+        Fronts is_processed so the common "new entry" case skips the
+        SQLite round trip entirely. A snapshot saved by close() is
+        reused when its row count still matches the table - a mismatch
+        (crash before close, external writes) falls back to a full
+        rescan, keeping SQLite the source of truth.
+        """
+        db_count = self.get_processed_count()
+
+        if self._bloom_path.exists():
+            try:
+                with open(self._bloom_path, "rb") as f:
+                    state = pickle.load(f)
+                if state.get("count") == db_count:
+                    logger.debug("bloom_loaded", path=str(self._bloom_path), keys=db_count)
+                    return _BloomFilter.from_state(state)
+                logger.debug("bloom_stale", saved=state.get("count"), actual=db_count)
+            except Exception as e:
+                logger.warning("bloom_load_failed", error=str(e))
+
+        bloom = _BloomFilter()
+        with self._get_connection() as conn:
+            cursor = conn.execute("SELECT entry_key FROM processed_entries")
+            for (entry_key,) in cursor:
+                bloom.add(entry_key)
+        return bloom
+
+    def _save_bloom(self) -> None:
+        """Snapshot the Bloom filter next to the database file."""
+        try:
+            state = self._bloom.to_state()
+            state["count"] = self.get_processed_count()
+            with open(self._bloom_path, "wb") as f:
+                pickle.dump(state, f)
+        except Exception as e:
+            logger.warning("bloom_save_failed", error=str(e))
 
     def _init_db(self) -> None:
         """Initialize the database schema."""
         with self._get_connection() as conn:
+            self._migrate_legacy_schema(conn)
+            # WITHOUT ROWID stores rows directly in the primary-key
+            # B-tree - no rowid indirection, and the 16-byte hash is the
+            # only key material indexed
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS processed_entries (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    entry_key TEXT UNIQUE NOT NULL,
+                    key_hash BLOB PRIMARY KEY,
+                    entry_key TEXT NOT NULL,
                     feed_url TEXT,
                     entry_title TEXT,
                     entry_link TEXT,
                     wp_post_id INTEGER,
                     wp_post_url TEXT,
                     processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_entry_key
-                ON processed_entries(entry_key)
+                ) WITHOUT ROWID
             """)
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_feed_url
                 ON processed_entries(feed_url)
             """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS feed_meta (
+                    feed_url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    modified TEXT,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
             conn.commit()
 
         logger.debug("database_initialized", path=str(self.db_path))
 
+    def _migrate_legacy_schema(self, conn: sqlite3.Connection) -> None:
+        """Rebuild a pre-hash processed_entries table in the new layout.
+
+        Older databases keyed rows on the raw entry_key string; rehash
+        those rows into the fixed-width key_hash schema once.
+        """
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(processed_entries)")}
+        if not columns or "key_hash" in columns:
+            return
+
+        rows = conn.execute(
+            """
+            SELECT entry_key, feed_url, entry_title, entry_link,
+                   wp_post_id, wp_post_url, processed_at
+            FROM processed_entries
+            """
+        ).fetchall()
+
+        conn.execute("DROP TABLE processed_entries")
+        conn.execute("""
+            CREATE TABLE processed_entries (
+                key_hash BLOB PRIMARY KEY,
+                entry_key TEXT NOT NULL,
+                feed_url TEXT,
+                entry_title TEXT,
+                entry_link TEXT,
+                wp_post_id INTEGER,
+                wp_post_url TEXT,
+                processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            ) WITHOUT ROWID
+        """)
+        conn.executemany(
+            """
+            INSERT OR REPLACE INTO processed_entries
+            (key_hash, entry_key, feed_url, entry_title, entry_link,
+             wp_post_id, wp_post_url, processed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [(_hash_key(row[0]), *tuple(row)) for row in rows],
+        )
+        conn.commit()
+
+        logger.info("schema_migrated", migrated_rows=len(rows))
+
     @contextmanager
     def _get_connection(self):
-        """Get a database connection context manager."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Yield the shared persistent connection under the store lock."""
+        with self._db_lock:
+            yield self._conn
+
+    @contextmanager
+    def transaction(self):
+        """Batch mark_processed calls into a single commit.
+
+        Inside the block, mark_processed buffers rows in memory instead of
+        opening a connection and committing per entry; on exit everything
+        is flushed with one executemany and one commit. The flush runs
+        even when the block raises, so already-published entries are never
+        lost. Buffers are per-thread, so concurrent feeds don't interleave.
+        """
+        if getattr(self._local, "pending", None) is not None:
+            # Already inside a transaction on this thread - just nest
+            yield
+            return
+
+        self._local.pending = []
+        self._local.pending_keys = set()
         try:
-            yield conn
+            yield
         finally:
-            conn.close()
+            pending = self._local.pending
+            self._local.pending = None
+            self._local.pending_keys = None
+            if pending:
+                with self._get_connection() as conn:
+                    conn.executemany(
+                        """
+                        INSERT INTO processed_entries
+                        (key_hash, entry_key, feed_url, entry_title, entry_link, wp_post_id, wp_post_url, processed_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(key_hash) DO UPDATE SET
+                            feed_url = excluded.feed_url,
+                            entry_title = excluded.entry_title,
+                            entry_link = excluded.entry_link,
+                            wp_post_id = excluded.wp_post_id,
+                            wp_post_url = excluded.wp_post_url,
+                            processed_at = excluded.processed_at
+                        """,
+                        pending,
+                    )
+                    conn.commit()
+                logger.debug("batch_committed", count=len(pending))
 
     def is_processed(self, entry_key: str) -> bool:
         """Check if an entry has already been processed.
@@ -75,10 +304,19 @@ class DedupeStore:
         Returns:
             True if entry was already processed.
         """
+        # Rows buffered in an open transaction count as processed
+        pending_keys = getattr(self._local, "pending_keys", None)
+        if pending_keys and entry_key in pending_keys:
+            return True
+
+        # Bloom miss means definitely new - skip the SQLite query
+        if entry_key not in self._bloom:
+            return False
+
         with self._get_connection() as conn:
             cursor = conn.execute(
-                "SELECT 1 FROM processed_entries WHERE entry_key = ?",
-                (entry_key,),
+                "SELECT 1 FROM processed_entries WHERE key_hash = ? LIMIT 1",
+                (_hash_key(entry_key),),
             )
             result = cursor.fetchone() is not None
 
@@ -87,6 +325,46 @@ class DedupeStore:
 
         return result
 
+    def is_processed_many(self, entry_keys: list[str]) -> set[str]:
+        """Check a batch of entry keys in one query.
+
+        Replaces N per-entry lookups with a single IN (...) scan - the
+        Bloom filter still prunes definitely-new keys first, so the
+        query only covers possible hits.
+
+        Args:
+            entry_keys: Unique keys to check.
+
+        Returns:
+            The subset of keys already processed.
+        """
+        if not entry_keys:
+            return set()
+
+        processed: set[str] = set()
+
+        # Rows buffered in an open transaction count as processed
+        pending_keys = getattr(self._local, "pending_keys", None)
+        if pending_keys:
+            processed.update(key for key in entry_keys if key in pending_keys)
+
+        candidates = [key for key in entry_keys if key not in processed and key in self._bloom]
+        if not candidates:
+            return processed
+
+        with self._get_connection() as conn:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(candidates), 900):
+                chunk = candidates[i : i + 900]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT entry_key FROM processed_entries WHERE key_hash IN ({placeholders})",
+                    [_hash_key(key) for key in chunk],
+                )
+                processed.update(row[0] for row in cursor)
+
+        return processed
+
     def mark_processed(
         self,
         entry_key: str,
@@ -106,24 +384,25 @@ class DedupeStore:
             wp_post_id: WordPress post ID (if published).
             wp_post_url: WordPress post URL (if published).
         """
-        with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO processed_entries
-                (entry_key, feed_url, entry_title, entry_link, wp_post_id, wp_post_url, processed_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    entry_key,
-                    feed_url,
-                    entry_title,
-                    entry_link,
-                    wp_post_id,
-                    wp_post_url,
-                    datetime.utcnow().isoformat(),
-                ),
+        if getattr(self._local, "pending", None) is not None:
+            # Inside a transaction block - buffer for a single batch commit
+            row = (
+                _hash_key(entry_key),
+                entry_key,
+                feed_url,
+                entry_title,
+                entry_link,
+                wp_post_id,
+                wp_post_url,
+                datetime.now(timezone.utc).isoformat(),
+            )
+            self._local.pending.append(row)
+            self._local.pending_keys.add(entry_key)
+            self._bloom.add(entry_key)
+        else:
+            self.mark_processed_many(
+                [(entry_key, feed_url, entry_title, entry_link, wp_post_id, wp_post_url)]
             )
-            conn.commit()
 
         logger.info(
             "entry_marked_processed",
@@ -131,6 +410,92 @@ class DedupeStore:
             wp_post_id=wp_post_id,
         )
 
+    def mark_processed_many(
+        self,
+        rows: list[tuple[str, str, str, str, Optional[int], Optional[str]]],
+    ) -> None:
+        """Mark a batch of entries processed in one transaction.
+
+        One executemany and one commit collapse N per-row fsyncs into
+        one, the usual SQLite bulk-insert win.
+
+        Args:
+            rows: Tuples of (entry_key, feed_url, entry_title, entry_link,
+                wp_post_id, wp_post_url).
+        """
+        if not rows:
+            return
+
+        now = datetime.now(timezone.utc).isoformat()
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                INSERT INTO processed_entries
+                (key_hash, entry_key, feed_url, entry_title, entry_link, wp_post_id, wp_post_url, processed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(key_hash) DO UPDATE SET
+                    feed_url = excluded.feed_url,
+                    entry_title = excluded.entry_title,
+                    entry_link = excluded.entry_link,
+                    wp_post_id = excluded.wp_post_id,
+                    wp_post_url = excluded.wp_post_url,
+                    processed_at = excluded.processed_at
+                """,
+                [(_hash_key(row[0]), *row, now) for row in rows],
+            )
+            conn.commit()
+
+        for row in rows:
+            self._bloom.add(row[0])
+
+    def get_feed_meta(self, feed_url: str) -> tuple[Optional[str], Optional[str]]:
+        """Get stored HTTP cache validators for a feed.
+
+        Args:
+            feed_url: URL of the feed.
+
+        Returns:
+            Tuple of (etag, modified), either may be None.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT etag, modified FROM feed_meta WHERE feed_url = ?",
+                (feed_url,),
+            )
+            row = cursor.fetchone()
+
+        if row is None:
+            return (None, None)
+        return (row["etag"], row["modified"])
+
+    def update_feed_meta(
+        self,
+        feed_url: str,
+        etag: Optional[str],
+        modified: Optional[str],
+    ) -> None:
+        """Store HTTP cache validators for a feed.
+
+        Args:
+            feed_url: URL of the feed.
+            etag: ETag header from the last successful fetch.
+            modified: Last-Modified header from the last successful fetch.
+        """
+        if not etag and not modified:
+            return
+
+        with self._get_connection() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO feed_meta (feed_url, etag, modified, updated_at)
+                VALUES (?, ?, ?, ?)
+                """,
+                (feed_url, etag, modified, datetime.now(timezone.utc).isoformat()),
+            )
+            conn.commit()
+
+        logger.debug("feed_meta_updated", feed_url=feed_url)
+
     def get_processed_count(self, feed_url: Optional[str] = None) -> int:
         """Get count of processed entries.
 
@@ -165,11 +530,14 @@ class DedupeStore:
         Returns:
             List of entry dictionaries.
         """
+        columns = """entry_key, feed_url, entry_title, entry_link,
+                     wp_post_id, wp_post_url, processed_at"""
+
         with self._get_connection() as conn:
             if feed_url:
                 cursor = conn.execute(
-                    """
-                    SELECT * FROM processed_entries
+                    f"""
+                    SELECT {columns} FROM processed_entries
                     WHERE feed_url = ?
                     ORDER BY processed_at DESC
                     LIMIT ?
@@ -178,8 +546,8 @@ class DedupeStore:
                 )
             else:
                 cursor = conn.execute(
-                    """
-                    SELECT * FROM processed_entries
+                    f"""
+                    SELECT {columns} FROM processed_entries
                     ORDER BY processed_at DESC
                     LIMIT ?
                     """,
@@ -199,5 +567,8 @@ class DedupeStore:
             count = cursor.rowcount
             conn.commit()
 
+        self._bloom = _BloomFilter()
+        self._bloom_path.unlink(missing_ok=True)
+
         logger.warning("database_cleared", deleted_count=count)
         return count
@@ -1,21 +1,31 @@
 """Utility modules."""
 
-from rss_to_wp.utils.email import build_summary_email, send_email_notification
+from rss_to_wp.utils.email import SmtpSender, build_summary_email, send_email_notification
 from rss_to_wp.utils.http import (
     create_http_session,
+    fetch_many,
     fetch_url_content,
     get_with_timeout,
     post_with_timeout,
 )
+from rss_to_wp.utils.json import json_dumps, json_loads
 from rss_to_wp.utils.logging import get_logger, setup_logging
+from rss_to_wp.utils.ratelimit import HostRateLimiter, TokenBucket, TokenBudgetTracker
 
 __all__ = [
     "create_http_session",
+    "fetch_many",
     "fetch_url_content",
     "get_with_timeout",
     "post_with_timeout",
     "get_logger",
     "setup_logging",
+    "json_dumps",
+    "json_loads",
     "send_email_notification",
     "build_summary_email",
+    "SmtpSender",
+    "HostRateLimiter",
+    "TokenBucket",
+    "TokenBudgetTracker",
 ]
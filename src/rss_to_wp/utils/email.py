@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import html
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.message import EmailMessage
+from string import Template
 from typing import Optional
 
 # Import directly from logging module to avoid circular import
@@ -13,6 +14,125 @@ from rss_to_wp.utils.logging import get_logger
 logger = get_logger("utils.email")
 
 
+class SmtpSender:
+    """Reusable SMTP connection for sending a batch of messages.
+
+    Opening a connection per message pays the TCP + STARTTLS + AUTH
+    round trips every time; this context manager does the handshake
+    once in __enter__ and sends any number of messages over the same
+    connection. If the server drops the connection mid-batch, send()
+    reconnects and retries once.
+    """
+
+    def __init__(
+        self,
+        smtp_email: str,
+        smtp_password: str,
+        smtp_server: str = "smtp.gmail.com",
+        smtp_port: int = 587,
+    ):
+        """Initialize the sender (no connection is opened yet).
+
+        Args:
+            smtp_email: Sender email address (also the login user).
+            smtp_password: SMTP password (app password for Gmail).
+            smtp_server: SMTP server address.
+            smtp_port: SMTP port.
+        """
+        self.smtp_email = smtp_email
+        self.smtp_password = smtp_password
+        self.smtp_server = smtp_server
+        self.smtp_port = smtp_port
+        self._server: Optional[smtplib.SMTP] = None
+
+    def connect(self) -> None:
+        """Open the connection and authenticate."""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        server.starttls()
+        server.login(self.smtp_email, self.smtp_password)
+        self._server = server
+
+    def reconnect(self) -> None:
+        """Drop the current connection and open a fresh one."""
+        self.close()
+        self.connect()
+
+    def close(self) -> None:
+        """Close the connection if open."""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except Exception:
+                pass
+            self._server = None
+
+    def send(self, msg) -> None:
+        """Send one message over the shared connection.
+
+        Args:
+            msg: A prepared email message object.
+
+        Raises:
+            smtplib.SMTPException: If the send fails even after one
+                reconnect attempt.
+        """
+        if self._server is None:
+            self.connect()
+
+        try:
+            self._server.send_message(msg)
+        except (smtplib.SMTPServerDisconnected, smtplib.SMTPException):
+            # Stale connection (server-side idle timeout) - retry once
+            # on a fresh one before giving up
+            logger.warning("smtp_send_retry", server=self.smtp_server)
+            self.reconnect()
+            self._server.send_message(msg)
+
+    def __enter__(self) -> "SmtpSender":
+        self.connect()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def build_message(
+    subject: str,
+    html_body: str,
+    from_email: str,
+    to_email: str,
+    text_body: Optional[str] = None,
+) -> EmailMessage:
+    """Build a ready-to-send email message.
+
+    Uses the modern EmailMessage API, which builds the multipart
+    structure and folds headers in one pass instead of the older
+    MIMEMultipart + MIMEText assembly.
+
+    Args:
+        subject: Email subject.
+        html_body: HTML email body.
+        from_email: Sender address.
+        to_email: Recipient address.
+        text_body: Plain text body (optional fallback).
+
+    Returns:
+        Prepared EmailMessage.
+    """
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"] = from_email
+    msg["To"] = to_email
+
+    if text_body:
+        msg.set_content(text_body)
+        msg.add_alternative(html_body, subtype="html")
+    else:
+        msg.set_content(html_body, subtype="html")
+
+    return msg
+
+
 def send_email_notification(
     smtp_email: str,
     smtp_password: str,
@@ -22,6 +142,7 @@ def send_email_notification(
     text_body: Optional[str] = None,
     smtp_server: str = "smtp.gmail.com",
     smtp_port: int = 587,
+    sender: Optional[SmtpSender] = None,
 ) -> bool:
     """Send an email notification.
 
@@ -34,29 +155,29 @@ def send_email_notification(
         text_body: Plain text body (optional fallback).
         smtp_server: SMTP server address.
         smtp_port: SMTP port.
+        sender: Optional already-connected SmtpSender to reuse. When
+            given, the TLS+AUTH handshake is skipped entirely.
 
     Returns:
         True if email sent successfully.
     """
     try:
-        # Create message
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = subject
-        msg["From"] = smtp_email
-        msg["To"] = to_email
-
-        # Add text and HTML parts
-        if text_body:
-            msg.attach(MIMEText(text_body, "plain"))
-        msg.attach(MIMEText(html_body, "html"))
+        msg = build_message(
+            subject=subject,
+            html_body=html_body,
+            from_email=smtp_email,
+            to_email=to_email,
+            text_body=text_body,
+        )
 
         # Connect and send
         logger.info("sending_email", to=to_email, subject=subject)
 
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()
-            server.login(smtp_email, smtp_password)
-            server.send_message(msg)
+        if sender is not None:
+            sender.send(msg)
+        else:
+            with SmtpSender(smtp_email, smtp_password, smtp_server, smtp_port) as s:
+                s.send(msg)
 
         logger.info("email_sent_successfully", to=to_email)
         return True
@@ -66,6 +187,55 @@ def send_email_notification(
         return False
 
 
+# Templates compiled once at import - the static CSS/header/footer bytes
+# are parsed a single time instead of being rebuilt from f-strings per run
+_SUMMARY_TPL = Template("""
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+                .header { background: #1a365d; color: white; padding: 20px; text-align: center; }
+                .content { padding: 20px; }
+                .article { background: #f7fafc; border-left: 4px solid #3182ce; padding: 15px; margin: 10px 0; }
+                .article-title { color: #2c5282; font-size: 16px; font-weight: bold; text-decoration: none; }
+                .article-feed { color: #718096; font-size: 12px; }
+                .stats { background: #edf2f7; padding: 15px; margin-top: 20px; border-radius: 5px; }
+                .footer { text-align: center; color: #a0aec0; font-size: 12px; padding: 20px; }
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h1>📰 $site_name Update</h1>
+            </div>
+            <div class="content">
+        $articles_html
+        <div class="stats">
+            <strong>Run Statistics:</strong><br>
+            📝 Articles Published: $article_count<br>
+            ⏭️ Duplicates Skipped: $skipped_count<br>
+            ❌ Errors: $error_count
+        </div>
+            </div>
+            <div class="footer">
+                <p>This is an automated notification from RSS to WordPress Automation</p>
+            </div>
+        </body>
+        </html>
+    """)
+
+_ARTICLE_TPL = Template("""
+                <div class="article">
+                    <a href="$url" class="article-title">$title</a>
+                    <div class="article-feed">From: $feed</div>
+                </div>
+            """)
+
+_NO_ARTICLES_HTML = (
+    "<h2>ℹ️ No New Articles</h2>"
+    "<p>No new articles were found in the configured feeds within the 48-hour window.</p>"
+)
+
+
 def build_summary_email(
     processed_articles: list[dict],
     skipped_count: int,
@@ -74,6 +244,9 @@ def build_summary_email(
 ) -> tuple[str, str]:
     """Build a summary email for the RSS run.
 
+    Article titles, URLs, and feed names are HTML-escaped on the way in,
+    so markup in upstream feed data can't leak into the notification.
+
     Args:
         processed_articles: List of dicts with title, url, feed_name.
         skipped_count: Number of skipped duplicates.
@@ -91,65 +264,24 @@ def build_summary_email(
     else:
         subject = f"📰 {site_name}: No New Articles (Run Complete)"
 
-    # HTML Body
-    html_parts = [
-        f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .header {{ background: #1a365d; color: white; padding: 20px; text-align: center; }}
-                .content {{ padding: 20px; }}
-                .article {{ background: #f7fafc; border-left: 4px solid #3182ce; padding: 15px; margin: 10px 0; }}
-                .article-title {{ color: #2c5282; font-size: 16px; font-weight: bold; text-decoration: none; }}
-                .article-feed {{ color: #718096; font-size: 12px; }}
-                .stats {{ background: #edf2f7; padding: 15px; margin-top: 20px; border-radius: 5px; }}
-                .footer {{ text-align: center; color: #a0aec0; font-size: 12px; padding: 20px; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>📰 {site_name} Update</h1>
-            </div>
-            <div class="content">
-        """
-    ]
-
     if article_count > 0:
-        html_parts.append("<h2>✅ New Articles Published</h2>")
-        for article in processed_articles:
-            title = article.get("title", "Untitled")
-            url = article.get("url", "#")
-            feed = article.get("feed_name", "Unknown Feed")
-            html_parts.append(f"""
-                <div class="article">
-                    <a href="{url}" class="article-title">{title}</a>
-                    <div class="article-feed">From: {feed}</div>
-                </div>
-            """)
+        articles_html = "<h2>✅ New Articles Published</h2>" + "".join(
+            _ARTICLE_TPL.substitute(
+                url=html.escape(article.get("url", "#"), quote=True),
+                title=html.escape(article.get("title", "Untitled")),
+                feed=html.escape(article.get("feed_name", "Unknown Feed")),
+            )
+            for article in processed_articles
+        )
     else:
-        html_parts.append("<h2>ℹ️ No New Articles</h2>")
-        html_parts.append("<p>No new articles were found in the configured feeds within the 48-hour window.</p>")
-
-    # Stats
-    html_parts.append(f"""
-        <div class="stats">
-            <strong>Run Statistics:</strong><br>
-            📝 Articles Published: {article_count}<br>
-            ⏭️ Duplicates Skipped: {skipped_count}<br>
-            ❌ Errors: {error_count}
-        </div>
-    """)
-
-    html_parts.append("""
-            </div>
-            <div class="footer">
-                <p>This is an automated notification from RSS to WordPress Automation</p>
-            </div>
-        </body>
-        </html>
-    """)
+        articles_html = _NO_ARTICLES_HTML
 
-    html_body = "".join(html_parts)
+    html_body = _SUMMARY_TPL.substitute(
+        site_name=html.escape(site_name),
+        articles_html=articles_html,
+        article_count=article_count,
+        skipped_count=skipped_count,
+        error_count=error_count,
+    )
 
     return subject, html_body
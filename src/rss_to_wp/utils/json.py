@@ -0,0 +1,32 @@
+"""JSON helpers with optional orjson acceleration.
+
+orjson decodes/encodes several times faster than the stdlib module; it
+is an optional dependency (install the `fast` extra), and everything
+falls back to stdlib json transparently when it is missing.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Union
+
+try:
+    import orjson
+
+    def json_loads(data: Union[str, bytes]) -> Any:
+        """Parse JSON from a string or bytes."""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize an object to a JSON string."""
+        return orjson.dumps(obj).decode("utf-8")
+
+except ImportError:
+    import json
+
+    def json_loads(data: Union[str, bytes]) -> Any:
+        """Parse JSON from a string or bytes."""
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize an object to a JSON string."""
+        return json.dumps(obj)
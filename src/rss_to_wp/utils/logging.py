@@ -9,6 +9,20 @@ from typing import Optional
 
 import structlog
 
+from rss_to_wp.utils.json import json_dumps
+
+
+def _render_json(obj, **_) -> str:
+    """Serialize a log event dict, preferring orjson when installed.
+
+    Non-JSON-native values (exceptions, Paths) are stringified so a
+    stray bind can't crash the log pipeline.
+    """
+    try:
+        return json_dumps(obj)
+    except TypeError:
+        return json_dumps({k: str(v) for k, v in obj.items()})
+
 
 def setup_logging(
     level: str = "INFO",
@@ -59,7 +73,7 @@ def setup_logging(
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_render_json),
         ]
     else:
         # Pretty console output for development
@@ -0,0 +1,152 @@
+"""Per-host rate limiting."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from rss_to_wp.utils.logging import get_logger
+
+logger = get_logger("utils.ratelimit")
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared across threads.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    acquire() only sleeps when no token is available, so short bursts
+    proceed immediately and parallel callers interleave up to the true
+    quota instead of serializing behind a fixed sleep.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Initialize the bucket.
+
+        Args:
+            rate: Token refill rate per second (sustained calls/sec).
+            capacity: Maximum tokens held (burst size).
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class TokenBudgetTracker:
+    """Rolling-window budget over both request count and token volume.
+
+    Tracks (timestamp, tokens) events in a 60-second window and blocks
+    callers until admitting the next request keeps both the
+    requests-per-minute and tokens-per-minute totals within budget.
+    Unlike a fixed inter-request sleep, bursts proceed immediately while
+    sustained load converges on the configured quota. Thread-safe.
+    """
+
+    WINDOW = 60.0
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """Initialize the tracker.
+
+        Args:
+            requests_per_minute: Maximum requests admitted per window.
+            tokens_per_minute: Maximum estimated tokens admitted per window.
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._events: deque[tuple[float, int]] = deque()
+        self._token_sum = 0
+        self._lock = threading.Lock()
+
+    def _evict(self, now: float) -> None:
+        """Drop events that fell out of the rolling window."""
+        cutoff = now - self.WINDOW
+        while self._events and self._events[0][0] <= cutoff:
+            _, tokens = self._events.popleft()
+            self._token_sum -= tokens
+
+    def await_capacity(self, estimated_tokens: int) -> None:
+        """Block until the request fits in both budgets, then record it.
+
+        Args:
+            estimated_tokens: Estimated input + output tokens for the call.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._evict(now)
+                if (
+                    len(self._events) < self.requests_per_minute
+                    and self._token_sum + estimated_tokens <= self.tokens_per_minute
+                ):
+                    self._events.append((now, estimated_tokens))
+                    self._token_sum += estimated_tokens
+                    return
+                # Capacity frees up when the oldest event leaves the window
+                wait = self._events[0][0] + self.WINDOW - now if self._events else 0.1
+            time.sleep(max(wait, 0.05))
+
+
+class HostRateLimiter:
+    """Rate limiter that throttles calls per host instead of globally.
+
+    Keeps a last-call timestamp per host, so requests to independent hosts
+    never serialize behind each other. Thread-safe.
+    """
+
+    def __init__(self, default_interval: float = 1.0):
+        """Initialize the rate limiter.
+
+        Args:
+            default_interval: Minimum seconds between calls to the same host.
+        """
+        self.default_interval = default_interval
+        self._last_call: dict[str, float] = {}
+        self._intervals: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def set_interval(self, host: str, min_interval: float) -> None:
+        """Set a per-host minimum interval, overriding the default.
+
+        Args:
+            host: Hostname (netloc) to configure.
+            min_interval: Minimum seconds between calls to this host.
+        """
+        with self._lock:
+            self._intervals[host] = min_interval
+
+    def acquire(self, host: str, min_interval: Optional[float] = None) -> None:
+        """Block until a call to the given host is allowed.
+
+        Args:
+            host: Hostname (netloc) being called.
+            min_interval: Optional one-off interval override.
+        """
+        if not host:
+            return
+
+        with self._lock:
+            interval = min_interval or self._intervals.get(host, self.default_interval)
+            now = time.time()
+            wait = self._last_call.get(host, 0.0) + interval - now
+            # Reserve the slot before sleeping so concurrent callers queue up
+            self._last_call[host] = max(now, now + wait)
+
+        if wait > 0:
+            logger.debug("rate_limit_wait", host=host, seconds=round(wait, 2))
+            time.sleep(wait)
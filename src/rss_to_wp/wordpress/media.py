@@ -3,15 +3,89 @@
 from __future__ import annotations
 
 import mimetypes
+from io import BytesIO
 from pathlib import Path
 from typing import Optional
 
 import requests
+from PIL import Image
 
-from rss_to_wp.utils import get_logger
+from rss_to_wp.utils import get_logger, json_loads
 
 logger = get_logger("wordpress.media")
 
+# Content types worth re-encoding before upload - already-efficient
+# formats (webp, avif, gif animations) are sent as-is
+_RECOMPRESS_TYPES = {"image/jpeg", "image/png"}
+
+# Common image extensions resolved without touching mimetypes, whose
+# first guess_type call initializes the global registry from disk
+_EXT_CONTENT_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".avif": "image/avif",
+}
+
+
+def _has_transparency(image: Image.Image) -> bool:
+    """Check whether an image carries an alpha channel or transparency.
+
+    Args:
+        image: Opened Pillow image.
+
+    Returns:
+        True if converting to JPEG would discard transparency.
+    """
+    return "A" in image.getbands() or "transparency" in image.info
+
+
+def _prepare_upload(
+    image_bytes: bytes,
+    filename: str,
+    content_type: str,
+) -> tuple[BytesIO, str, str]:
+    """Re-encode large JPEG/PNG images to progressive JPEG for upload.
+
+    Featured images from RSS feeds are often multi-MB originals;
+    re-encoding at quality 82 roughly halves the bytes sent over TLS
+    without visible quality loss. The smaller of original and
+    re-encoded wins, and any Pillow failure falls back to the raw
+    bytes. Images with transparency are sent as-is - JPEG has no alpha
+    channel, so flattening would corrupt the transparent regions.
+
+    Args:
+        image_bytes: Original image content.
+        filename: Original filename.
+        content_type: Detected content type.
+
+    Returns:
+        Tuple of (stream, filename, content_type) to upload.
+    """
+    if content_type in _RECOMPRESS_TYPES:
+        try:
+            image = Image.open(BytesIO(image_bytes))
+            if _has_transparency(image):
+                return BytesIO(image_bytes), filename, content_type
+            if image.mode not in ("RGB", "L"):
+                image = image.convert("RGB")
+            buf = BytesIO()
+            image.save(buf, "JPEG", quality=82, optimize=True, progressive=True)
+            if buf.tell() < len(image_bytes):
+                logger.debug(
+                    "media_recompressed",
+                    original_bytes=len(image_bytes),
+                    upload_bytes=buf.tell(),
+                )
+                buf.seek(0)
+                return buf, f"{Path(filename).stem}.jpg", "image/jpeg"
+        except Exception as e:
+            logger.warning("media_recompress_failed", filename=filename, error=str(e))
+
+    return BytesIO(image_bytes), filename, content_type
+
 
 def wp_upload_media(
     image_bytes: bytes,
@@ -42,28 +116,43 @@ def wp_upload_media(
     url = f"{base_url}/wp-json/wp/v2/media"
 
     # Determine content type
-    content_type, _ = mimetypes.guess_type(filename)
+    content_type = _EXT_CONTENT_TYPES.get(Path(filename).suffix.lower())
+    if not content_type:
+        content_type, _ = mimetypes.guess_type(filename)
     if not content_type:
         content_type = "image/jpeg"
 
-    headers = {
-        "Content-Disposition": f'attachment; filename="{filename}"',
-        "Content-Type": content_type,
-    }
+    stream, filename, content_type = _prepare_upload(image_bytes, filename, content_type)
 
     logger.info("uploading_media", filename=filename, size_bytes=len(image_bytes))
 
     try:
-        response = session.post(
-            url,
-            data=image_bytes,
-            headers=headers,
-            auth=(username, password),
-            timeout=(10, 60),
-        )
+        if alt_text:
+            # Multipart create carries alt_text in the same request, so
+            # no follow-up POST per image. Content-Type is cleared so
+            # requests sets the multipart boundary itself.
+            response = session.post(
+                url,
+                files={"file": (filename, stream, content_type)},
+                data={"alt_text": alt_text, "title": alt_text},
+                headers={"Content-Type": None},
+                auth=(username, password),
+                timeout=(10, 60),
+            )
+        else:
+            response = session.post(
+                url,
+                data=stream,
+                headers={
+                    "Content-Disposition": f'attachment; filename="{filename}"',
+                    "Content-Type": content_type,
+                },
+                auth=(username, password),
+                timeout=(10, 60),
+            )
         response.raise_for_status()
 
-        media_data = response.json()
+        media_data = json_loads(response.content)
         media_id = media_data.get("id")
 
         if not media_id:
@@ -71,11 +160,6 @@ def wp_upload_media(
             return None
 
         logger.info("media_uploaded", media_id=media_id, filename=filename)
-
-        # Update alt text if provided
-        if alt_text:
-            _update_media_alt(media_id, alt_text, base_url, username, password, session)
-
         return media_id
 
     except requests.exceptions.HTTPError as e:
@@ -101,6 +185,9 @@ def _update_media_alt(
 ) -> None:
     """Update the alt text for a media item.
 
+    Uploads set alt_text in the create request itself; this remains for
+    retroactively fixing media uploaded without one.
+
     Args:
         media_id: WordPress media ID.
         alt_text: Alt text to set.